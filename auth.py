@@ -2,13 +2,12 @@
 """Standalone authentication script for Spotify MCP."""
 
 import sys
-import json
-import time
 import threading
 import webbrowser
 from pathlib import Path
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs, urlencode
+import orjson
 import requests
 import base64
 from datetime import datetime, timedelta
@@ -20,6 +19,25 @@ from dotenv import load_dotenv
 CONFIG_DIR = Path.home() / ".spotify-plus-mcp"
 CONFIG_FILE = CONFIG_DIR / "spotify-config.json"
 
+# The requested scope set is static, so join it once at import.
+SCOPES = [
+    "user-read-currently-playing",
+    "user-read-playback-state",
+    "user-modify-playback-state",
+    "app-remote-control",
+    "streaming",
+    "playlist-read-private",
+    "playlist-read-collaborative",
+    "playlist-modify-private",
+    "playlist-modify-public",
+    "user-read-playback-position",
+    "user-top-read",
+    "user-read-recently-played",
+    "user-library-modify",
+    "user-library-read"
+]
+SCOPE_STR = " ".join(SCOPES)
+
 # Load environment variables
 load_dotenv()
 
@@ -37,11 +55,12 @@ class AuthHandler(BaseHTTPRequestHandler):
                 self.send_response(400)
                 self.send_header('Content-type', 'text/html')
                 self.end_headers()
-                self.wfile.write(b'<html><body><h1>Authentication Failed</h1><p>Error: ' + 
-                                params['error'][0].encode() + 
+                self.wfile.write(b'<html><body><h1>Authentication Failed</h1><p>Error: ' +
+                                params['error'][0].encode() +
                                 b'</p><p>Please close this window and try again.</p></body></html>')
                 self.server.auth_code = None
                 self.server.error = params['error'][0]
+                self.server.done.set()
             elif 'code' in params:
                 self.send_response(200)
                 self.send_header('Content-type', 'text/html')
@@ -50,6 +69,7 @@ class AuthHandler(BaseHTTPRequestHandler):
                                b'<p>You can now close this window and return to the application.</p></body></html>')
                 self.server.auth_code = params['code'][0]
                 self.server.error = None
+                self.server.done.set()
             else:
                 self.send_response(400)
                 self.send_header('Content-type', 'text/html')
@@ -58,6 +78,7 @@ class AuthHandler(BaseHTTPRequestHandler):
                                b'<p>No authorization code received.</p></body></html>')
                 self.server.auth_code = None
                 self.server.error = "No code received"
+                self.server.done.set()
         else:
             self.send_response(404)
             self.end_headers()
@@ -67,13 +88,34 @@ class AuthHandler(BaseHTTPRequestHandler):
         pass
 
 
+class AuthHTTPServer(HTTPServer):
+    """HTTP server whose handler signals callback completion via an Event."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.auth_code = None
+        self.error = None
+        self.done = threading.Event()
+
+
+_config_dir_ensured = False
+
+
+def _ensure_config_dir():
+    """Create the config directory once per process."""
+    global _config_dir_ensured
+    if not _config_dir_ensured:
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        _config_dir_ensured = True
+
+
 def load_config():
     """Load or create configuration."""
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    
+    _ensure_config_dir()
+
     if CONFIG_FILE.exists():
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
+        with open(CONFIG_FILE, 'rb') as f:
+            return orjson.loads(f.read())
     
     # Create default config from environment variables
     config = {
@@ -90,9 +132,12 @@ def load_config():
 
 
 def save_config(config):
-    """Save configuration to file."""
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=2)
+    """Save configuration to file atomically."""
+    buf = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    tmp_file = CONFIG_FILE.with_suffix('.json.tmp')
+    with open(tmp_file, 'wb', buffering=0) as f:
+        f.write(buf)
+    os.replace(tmp_file, CONFIG_FILE)
     print(f"✓ Configuration saved to {CONFIG_FILE}")
 
 
@@ -113,12 +158,15 @@ def exchange_code_for_token(code, config):
         "redirect_uri": config['redirect_uri']
     }
     
-    response = requests.post("https://accounts.spotify.com/api/token", headers=headers, data=data)
+    response = requests.post(
+        "https://accounts.spotify.com/api/token", headers=headers, data=data,
+        timeout=(3.05, 10.0)
+    )
     
     if response.status_code != 200:
         raise Exception(f"Failed to exchange code: {response.text}")
-    
-    return response.json()
+
+    return orjson.loads(response.content)
 
 
 def run_auth_server(port=8888):
@@ -138,39 +186,21 @@ def run_auth_server(port=8888):
     state = secrets.token_urlsafe(16)
     
     # Build authorization URL
-    scopes = [
-        "user-read-currently-playing",
-        "user-read-playback-state",
-        "user-modify-playback-state",
-        "app-remote-control",
-        "streaming",
-        "playlist-read-private",
-        "playlist-read-collaborative",
-        "playlist-modify-private",
-        "playlist-modify-public",
-        "user-read-playback-position",
-        "user-top-read",
-        "user-read-recently-played",
-        "user-library-modify",
-        "user-library-read"
-    ]
-    
     params = {
         "client_id": config['client_id'],
         "response_type": "code",
         "redirect_uri": config['redirect_uri'],
-        "scope": " ".join(scopes),
+        "scope": SCOPE_STR,
         "state": state,
         "show_dialog": "false"
     }
     
     auth_url = f"https://accounts.spotify.com/authorize?{urlencode(params)}"
     
-    # Start HTTP server
-    server = HTTPServer(('127.0.0.1', port), AuthHandler)
-    server.auth_code = None
-    server.error = None
-    server.timeout = 120  # 2 minute timeout
+    # Start HTTP server on a worker thread; the main thread just waits on
+    # the Event instead of looping over handle_request().
+    server = AuthHTTPServer(('127.0.0.1', port), AuthHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
     
     print(f"Starting authentication server on port {port}...")
     print(f"Opening browser for Spotify authorization...")
@@ -183,14 +213,14 @@ def run_auth_server(port=8888):
     
     # Wait for callback
     print("Waiting for authorization callback...")
-    
-    start_time = time.time()
-    while server.auth_code is None and server.error is None:
-        server.handle_request()
-        if time.time() - start_time > 120:
-            print("Error: Authentication timeout (2 minutes)")
-            return False
-    
+
+    completed = server.done.wait(timeout=120)
+    server.shutdown()
+
+    if not completed:
+        print("Error: Authentication timeout (2 minutes)")
+        return False
+
     if server.error:
         print(f"Error: Authentication failed - {server.error}")
         return False
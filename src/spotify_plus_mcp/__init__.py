@@ -1,3 +1,8 @@
+from dotenv import load_dotenv
+
+# Load .env once for the whole package; submodules read os.environ directly.
+load_dotenv()
+
 from . import server
 import asyncio
 
@@ -1,74 +1,110 @@
 """Authentication manager with persistent token storage and automatic refresh."""
 
+import functools
 import logging
+import re
+import threading
 import time
 from typing import Optional, Dict, Any
-from urllib.parse import urlencode, parse_qs, urlparse
+from urllib.parse import urlencode, unquote
+import orjson
 import requests
 import base64
 
 from .config import SpotifyConfig
 
+# Fast path for pulling the authorization code out of a pasted callback URL
+# without a full urlparse + parse_qs pass.
+_CODE_RE = re.compile(r'[?&]code=([^&]+)')
+
+# (connect, read) timeout for token endpoint calls.
+_TOKEN_TIMEOUT = (3.05, 10.0)
+
 
 class SpotifyAuthManager:
     """Manages Spotify OAuth authentication with persistent storage."""
     
     TOKEN_URL = "https://accounts.spotify.com/api/token"
     AUTH_URL = "https://accounts.spotify.com/authorize"
-    
+
+    # Refresh this many seconds before the token actually expires.
+    REFRESH_MARGIN = 30
+
     def __init__(self, logger: logging.Logger):
         self.logger = logger
         self.config = SpotifyConfig()
         self.config.load()
-        
-    def get_auth_url(self) -> str:
-        """Generate the authorization URL for user to visit."""
+        self._refresh_lock = threading.Lock()
+        self._refresh_timer: Optional[threading.Timer] = None
+        # Reuse one session so hourly refreshes don't redo the TLS handshake.
+        self._session = requests.Session()
+        self._session.mount(
+            'https://', requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4)
+        )
+        # Credentials are fixed for the process lifetime, so encode the
+        # Basic-auth header once instead of per token call.
+        auth_str = f"{self.config.get('client_id')}:{self.config.get('client_secret')}"
+        auth_b64 = base64.b64encode(auth_str.encode('ascii')).decode('ascii')
+        self._token_headers = {
+            "Authorization": f"Basic {auth_b64}",
+            "Content-Type": "application/x-www-form-urlencoded"
+        }
+        self._redirect_uri = self.config.get("redirect_uri")
+        self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """Arm a daemon timer to refresh the token shortly before expiry."""
+        expiry_epoch = self.config.expiry_epoch
+        if expiry_epoch is None or not self.config.get("refresh_token"):
+            return
+        delay = max(0, expiry_epoch - time.time() - self.REFRESH_MARGIN)
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        self._refresh_timer = threading.Timer(delay, self.refresh_access_token)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+        self.logger.info(f"Scheduled token refresh in {delay:.0f}s")
+
+    @functools.cached_property
+    def _auth_url(self) -> str:
+        """Fully-formed authorization URL, built once from static config."""
         params = {
             "client_id": self.config.get("client_id"),
             "response_type": "code",
-            "redirect_uri": self.config.get("redirect_uri"),
+            "redirect_uri": self._redirect_uri,
             "scope": " ".join(self.config.get("scopes", [])),
             "show_dialog": "false"
         }
         return f"{self.AUTH_URL}?{urlencode(params)}"
+
+    def get_auth_url(self) -> str:
+        """Generate the authorization URL for user to visit."""
+        # client_id, redirect_uri and scopes are fixed for the process
+        # lifetime, so the URL is assembled once and reused.
+        return self._auth_url
         
     def exchange_code(self, code: str) -> Dict[str, Any]:
         """Exchange authorization code for access and refresh tokens."""
         # Extract code if full URL is provided
         if code.startswith("http"):
-            parsed_url = urlparse(code)
-            query_params = parse_qs(parsed_url.query)
-            if "code" in query_params:
-                code = query_params["code"][0]
-            else:
+            match = _CODE_RE.search(code)
+            if not match:
                 raise ValueError("No authorization code found in the provided URL")
+            code = unquote(match.group(1))
                 
-        client_id = self.config.get("client_id")
-        client_secret = self.config.get("client_secret")
-        
-        # Prepare the request
-        auth_str = f"{client_id}:{client_secret}"
-        auth_bytes = auth_str.encode('ascii')
-        auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
-        
-        headers = {
-            "Authorization": f"Basic {auth_b64}",
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
-        
         data = {
             "grant_type": "authorization_code",
             "code": code,
-            "redirect_uri": self.config.get("redirect_uri")
+            "redirect_uri": self._redirect_uri
         }
-        
-        response = requests.post(self.TOKEN_URL, headers=headers, data=data)
+
+        response = self._session.post(self.TOKEN_URL, headers=self._token_headers, data=data, timeout=_TOKEN_TIMEOUT)
         
         if response.status_code != 200:
             self.logger.error(f"Token exchange failed: {response.text}")
             raise Exception(f"Failed to exchange code: {response.text}")
             
-        token_info = response.json()
+        token_info = orjson.loads(response.content)
         
         # Store tokens in config
         self.config.update_tokens(
@@ -78,40 +114,32 @@ class SpotifyAuthManager:
         )
         
         self.logger.info("Successfully exchanged code for tokens")
+        self._schedule_refresh()
         return token_info
         
     def refresh_access_token(self) -> Optional[str]:
         """Refresh the access token using the refresh token."""
+        with self._refresh_lock:
+            return self._refresh_access_token_locked()
+
+    def _refresh_access_token_locked(self) -> Optional[str]:
         refresh_token = self.config.get("refresh_token")
         if not refresh_token:
             self.logger.error("No refresh token available")
             return None
-            
-        client_id = self.config.get("client_id")
-        client_secret = self.config.get("client_secret")
-        
-        # Prepare the request
-        auth_str = f"{client_id}:{client_secret}"
-        auth_bytes = auth_str.encode('ascii')
-        auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
-        
-        headers = {
-            "Authorization": f"Basic {auth_b64}",
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
-        
+
         data = {
             "grant_type": "refresh_token",
             "refresh_token": refresh_token
         }
-        
-        response = requests.post(self.TOKEN_URL, headers=headers, data=data)
+
+        response = self._session.post(self.TOKEN_URL, headers=self._token_headers, data=data, timeout=_TOKEN_TIMEOUT)
         
         if response.status_code != 200:
             self.logger.error(f"Token refresh failed: {response.text}")
             return None
             
-        token_info = response.json()
+        token_info = orjson.loads(response.content)
         
         # Update stored tokens
         self.config.update_tokens(
@@ -121,6 +149,9 @@ class SpotifyAuthManager:
         )
         
         self.logger.info("Successfully refreshed access token")
+
+        # Keep the proactive refresh cycle going for the new token.
+        self._schedule_refresh()
         return token_info["access_token"]
         
     def get_valid_token(self) -> Optional[str]:
@@ -141,5 +172,8 @@ class SpotifyAuthManager:
         
     def clear_tokens(self):
         """Clear all stored tokens."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
         self.config.clear_tokens()
         self.logger.info("Cleared all stored tokens")
\ No newline at end of file
@@ -1,12 +1,14 @@
 """Configuration management for Spotify MCP with persistent token storage."""
 
-import json
 import os
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 import logging
 
+import orjson
+
 # Get the directory where the package is installed
 PACKAGE_DIR = Path(__file__).parent
 # Look for config file in user's home directory
@@ -15,19 +17,48 @@ CONFIG_FILE = CONFIG_DIR / "spotify-config.json"
 
 logger = logging.getLogger(__name__)
 
+# Fields mirrored as direct attributes because auth checks read them on
+# every tool call.
+_HOT_FIELDS = ('client_id', 'client_secret', 'access_token', 'refresh_token')
+
 
 class SpotifyConfig:
     """Manages Spotify configuration and persistent token storage."""
-    
+
+    # The config dir only needs to be created once per process, not on
+    # every SpotifyConfig construction.
+    _dir_ensured = False
+
+    __slots__ = (
+        'config_file', 'config_dir', '_config', '_expiry_epoch',
+        'client_id', 'client_secret', 'access_token', 'refresh_token',
+    )
+
     def __init__(self):
         self.config_file = CONFIG_FILE
         self.config_dir = CONFIG_DIR
         self._config = None
+        self._expiry_epoch: Optional[float] = None
+        self.client_id: Optional[str] = None
+        self.client_secret: Optional[str] = None
+        self.access_token: Optional[str] = None
+        self.refresh_token: Optional[str] = None
         self._ensure_config_dir()
+
+    def _sync_hot_fields(self):
+        """Mirror frequently checked keys from the config dict onto slots."""
+        cfg = self._config or {}
+        self.client_id = cfg.get("client_id")
+        self.client_secret = cfg.get("client_secret")
+        self.access_token = cfg.get("access_token")
+        self.refresh_token = cfg.get("refresh_token")
         
     def _ensure_config_dir(self):
-        """Ensure the configuration directory exists."""
+        """Ensure the configuration directory exists (once per process)."""
+        if SpotifyConfig._dir_ensured:
+            return
         self.config_dir.mkdir(parents=True, exist_ok=True)
+        SpotifyConfig._dir_ensured = True
         
     def load(self) -> Dict[str, Any]:
         """Load configuration from file or create default."""
@@ -36,8 +67,10 @@ class SpotifyConfig:
             
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    self._config = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    self._config = orjson.loads(f.read())
+                    self._cache_expiry_epoch()
+                    self._sync_hot_fields()
                     logger.info(f"Loaded config from {self.config_file}")
                     return self._config
             except Exception as e:
@@ -45,6 +78,7 @@ class SpotifyConfig:
                 
         # Create default config
         self._config = self._create_default_config()
+        self._sync_hot_fields()
         self.save()
         return self._config
         
@@ -81,8 +115,14 @@ class SpotifyConfig:
             return
             
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self._config, f, indent=2)
+            # Serialize once and write through a tempfile + os.replace so the
+            # token file is updated with a single write and never left
+            # half-written if we crash mid-save.
+            buf = orjson.dumps(self._config)
+            tmp_file = self.config_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'wb', buffering=0) as f:
+                f.write(buf)
+            os.replace(tmp_file, self.config_file)
             logger.info(f"Saved config to {self.config_file}")
         except Exception as e:
             logger.error(f"Error saving config: {e}")
@@ -91,13 +131,17 @@ class SpotifyConfig:
         """Get configuration value."""
         if self._config is None:
             self.load()
+        if key in _HOT_FIELDS:
+            value = getattr(self, key)
+            return default if value is None else value
         return self._config.get(key, default)
-        
+
     def set(self, key: str, value):
         """Set configuration value and save."""
         if self._config is None:
             self.load()
         self._config[key] = value
+        self._sync_hot_fields()
         self.save()
         
     def update_tokens(self, access_token: str, refresh_token: str = None, expires_in: int = 3600):
@@ -106,36 +150,49 @@ class SpotifyConfig:
             self.load()
             
         self._config["access_token"] = access_token
+        self.access_token = access_token
         if refresh_token:
             self._config["refresh_token"] = refresh_token
-            
+            self.refresh_token = refresh_token
+
         # Calculate expiration time (slightly before actual expiration for safety)
         expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
         self._config["expires_at"] = expires_at.isoformat()
-        
+        self._expiry_epoch = expires_at.timestamp()
+
         self.save()
         logger.info("Updated tokens in configuration")
         
-    def is_token_expired(self) -> bool:
-        """Check if the access token has expired."""
+    @property
+    def expiry_epoch(self) -> Optional[float]:
+        """Epoch timestamp at which the access token expires, if known."""
         if self._config is None:
             self.load()
-            
-        expires_at = self._config.get("expires_at")
+        return self._expiry_epoch
+
+    def _cache_expiry_epoch(self):
+        """Parse the stored expiry timestamp once so checks avoid re-parsing."""
+        expires_at = self._config.get("expires_at") if self._config else None
         if not expires_at:
-            return True
-            
+            self._expiry_epoch = None
+            return
         try:
-            expiry_time = datetime.fromisoformat(expires_at)
-            return datetime.now() >= expiry_time
+            self._expiry_epoch = datetime.fromisoformat(expires_at).timestamp()
         except Exception:
-            return True
+            self._expiry_epoch = None
+
+    def is_token_expired(self) -> bool:
+        """Check if the access token has expired."""
+        if self._config is None:
+            self.load()
+
+        return self._expiry_epoch is None or time.time() >= self._expiry_epoch
             
     def has_tokens(self) -> bool:
         """Check if we have stored tokens."""
         if self._config is None:
             self.load()
-        return bool(self._config.get("access_token") and self._config.get("refresh_token"))
+        return bool(self.access_token and self.refresh_token)
         
     def clear_tokens(self):
         """Clear stored tokens."""
@@ -144,10 +201,13 @@ class SpotifyConfig:
         self._config["access_token"] = None
         self._config["refresh_token"] = None
         self._config["expires_at"] = None
+        self._expiry_epoch = None
+        self.access_token = None
+        self.refresh_token = None
         self.save()
         
     def is_configured(self) -> bool:
         """Check if the basic configuration is present."""
         if self._config is None:
             self.load()
-        return bool(self._config.get("client_id") and self._config.get("client_secret"))
\ No newline at end of file
+        return bool(self.client_id and self.client_secret)
\ No newline at end of file
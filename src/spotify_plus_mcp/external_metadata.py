@@ -3,80 +3,283 @@ External metadata sources for enhanced music discovery.
 Integrates with Last.fm and MusicBrainz APIs to provide additional music metadata.
 """
 
+import contextlib
+import functools
 import logging
 import os
 import time
 import threading
-from typing import Dict, List, Optional, Any
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional
 from urllib.parse import quote_plus
 
+import orjson
 import requests
-from dotenv import load_dotenv
-
-load_dotenv()
 
 LASTFM_API_KEY = os.getenv("LASTFM_API_KEY")
 LASTFM_BASE_URL = "https://ws.audioscrobbler.com/2.0/"
 MUSICBRAINZ_BASE_URL = "https://musicbrainz.org/ws/2/"
 
+# Fixed Last.fm query parameters, built once instead of per call.
+# Shared immutable fallback for defensive .get chains; avoids allocating
+# a fresh empty dict per missing key while parsing responses.
+_EMPTY: Dict[str, Any] = {}
+# Shared fallback so _last_image never allocates for absent image lists.
+_NO_IMAGES = (_EMPTY,)
+
+# Pre-encoded URL prefix so each call appends method/query fragments
+# instead of running requests' params encoder over the same base pairs.
+_LASTFM_URL_BASE = f"{LASTFM_BASE_URL}?format=json&api_key={LASTFM_API_KEY}"
+
 # Rate limiting for MusicBrainz (1 request per second)
 MUSICBRAINZ_RATE_LIMIT = 1.0
 
+# Last.fm is more lenient; keep bursts under ~5 requests per second so a
+# fan-out of parallel lookups can't trip the per-key limit into 429s.
+LASTFM_RATE_LIMIT = 0.2
+
+# Bound every outbound call so a wedged connection can't pin a pool worker.
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 10.0
+
+# TTLs for the in-process metadata cache; artist data drifts much more
+# slowly than track data.
+TRACK_CACHE_TTL = 600.0
+ARTIST_CACHE_TTL = 3600.0
+# Failed lookups are cached too, but only briefly, so a Last.fm outage
+# doesn't hammer the API while staying recoverable.
+NEGATIVE_CACHE_TTL = 60.0
+_CACHE_MAX_ENTRIES = 1024
+
+
+def _norm(value: str) -> str:
+    """Normalize a name for cache keying so trivially different spellings
+    ("Radiohead" vs "radiohead ") share one entry."""
+    return unicodedata.normalize('NFKC', value).casefold().strip()
+
+
+# Optional precomputed similarity table: a JSON file next to this module
+# mapping artist names to their similar-artist rows, regenerated offline.
+# When present, lookups for those artists skip Last.fm entirely.
+_PRECOMPUTED_PATH = Path(__file__).with_name('similar_artists.json')
+
+
+def _load_precomputed() -> Dict[str, List[Dict[str, Any]]]:
+    try:
+        raw = orjson.loads(_PRECOMPUTED_PATH.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except Exception:
+        logging.getLogger(__name__).warning(
+            "Ignoring unreadable precomputed similarity table at %s", _PRECOMPUTED_PATH
+        )
+        return {}
+    return {_norm(name): rows for name, rows in raw.items()}
+
+
+_PRECOMPUTED = _load_precomputed()
+
+
 class RateLimiter:
-    """Thread-safe rate limiter for MusicBrainz API."""
-    
-    def __init__(self, rate_limit: float = MUSICBRAINZ_RATE_LIMIT):
-        self._rate_limit = rate_limit
-        self._last_request = 0.0
-        self._lock = threading.Lock()
-    
+    """Thread-safe rate limiter for MusicBrainz API.
+
+    The design also holds on free-threaded (PEP 703) builds: the lock is
+    taken only for the few instructions that reserve the next slot, never
+    across the sleep, so removing the GIL adds no new contention window.
+    Plain attribute reads/writes on the int are not atomic without the
+    GIL, which is why the reserve step stays under the lock rather than
+    relying on a ctypes integer.
+
+    Callers that only ever invoke the limiter from one thread can pass
+    ``thread_safe=False`` to swap the lock for a no-op context manager
+    and skip the acquire/release on every call. The caller owns that
+    guarantee; an unsynchronized limiter shared across threads can
+    under-space requests.
+    """
+
+    def __init__(self, rate_limit: float = MUSICBRAINZ_RATE_LIMIT, clock=None,
+                 thread_safe: bool = True):
+        self._rate_limit_ns = int(rate_limit * 1e9)
+        self._last_request_ns = 0
+        self._lock = threading.Lock() if thread_safe else contextlib.nullcontext()
+        # Time source is injectable so tests can script it instead of
+        # monkey-patching the time module; binding the functions here also
+        # makes each call one attribute lookup instead of a module lookup.
+        self._now_ns = clock.monotonic_ns if clock is not None else time.monotonic_ns
+        self._sleep = clock.sleep if clock is not None else time.sleep
+
     def wait_if_needed(self):
         """Wait if necessary to respect rate limits."""
+        # Integer nanosecond timestamps from time.monotonic_ns() so NTP
+        # clock jumps can't break the rate guarantee and slot arithmetic
+        # stays exact. The lock guards only the compare-and-set that
+        # reserves the next slot (CPython has no cross-platform atomic
+        # int64, so this is the CAS step); the sleep happens outside it so
+        # concurrent callers queue up on successive slots, not the mutex.
         with self._lock:
-            current_time = time.time()
-            time_since_last = current_time - self._last_request
-            
-            if time_since_last < self._rate_limit:
-                sleep_time = self._rate_limit - time_since_last
-                time.sleep(sleep_time)
-            
-            self._last_request = time.time()
+            now_ns = self._now_ns()
+            deadline_ns = self._last_request_ns + self._rate_limit_ns
+            if now_ns >= deadline_ns:
+                self._last_request_ns = now_ns
+                sleep_ns = 0
+            else:
+                self._last_request_ns = deadline_ns
+                sleep_ns = deadline_ns - now_ns
+
+        if sleep_ns:
+            self._sleep(sleep_ns / 1e9)
+
+    def peek_remaining_wait(self, now_ns: Optional[int] = None) -> float:
+        """Seconds a caller arriving now would wait, without reserving a slot.
+
+        Lock-free monitoring read: a single attribute load is atomic in
+        CPython, and a stale answer is fine for observability purposes.
+        """
+        if now_ns is None:
+            now_ns = self._now_ns()
+        return max(0, self._last_request_ns + self._rate_limit_ns - now_ns) / 1e9
 
 _musicbrainz_rate_limiter = RateLimiter()
+_lastfm_rate_limiter = RateLimiter(LASTFM_RATE_LIMIT)
+
+# Shared pool for overlapping independent Last.fm / MusicBrainz round-trips.
+_metadata_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ext-metadata")
+
+
+def _build_shared_session() -> requests.Session:
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'spotify-mcp/1.0 (https://github.com/omniwaifu/spotify-mcp)'
+    })
+    # Keep-alive pool sized for the parallel Last.fm/MusicBrainz fetches
+    # so the TLS handshake to each host is paid once, not per lookup.
+    # HTTP/1.1 keep-alive is deliberate: MusicBrainz is throttled to one
+    # request per second here, so HTTP/2 multiplexing (an httpx migration)
+    # would never overlap streams on this session anyway.
+    adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=32)
+    session.mount('https://', adapter)
+    # Default timeout for every request issued through this session.
+    session.request = functools.partial(
+        session.request, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)
+    )
+    return session
+
+
+# One session for all client instances: each requests.Session owns its own
+# urllib3 PoolManager, so per-instance sessions would each redo TCP+TLS to
+# audioscrobbler and musicbrainz.
+_SHARED_SESSION = _build_shared_session()
 
 
 class ExternalMetadataClient:
     """Client for fetching metadata from external sources like Last.fm and MusicBrainz."""
-    
+
     def __init__(self, logger: logging.Logger):
         self.logger = logger
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'spotify-mcp/1.0 (https://github.com/omniwaifu/spotify-mcp)'
-        })
-    
+        self.session = _SHARED_SESSION
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Single-flight map: concurrent cache misses on the same key attach
+        # to the first caller's future instead of duplicating the fetch.
+        self._inflight: Dict[Hashable, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def close(self):
+        """Release the pooled keep-alive connections."""
+        self.session.close()
+
+    @staticmethod
+    def _last_image(item: Dict[str, Any]) -> Optional[str]:
+        """Return the URL of the largest (last) image in a Last.fm image list."""
+        # Branchless: missing/empty image lists fall through a shared empty
+        # dict, and Last.fm's empty-string '#text' placeholders collapse to
+        # None so callers see one "no image" value.
+        return (item.get('image') or _NO_IMAGES)[-1].get('#text') or None
+
+    def _put(self, key: Hashable, value: Any, ttl: float):
+        """Store value under key with its own expiry, evicting FIFO past cap."""
+        expires_at = time.monotonic() + ttl
+        with self._cache_lock:
+            self._cache[key] = (expires_at, value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > _CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+    def _cached(self, key: Hashable, ttl: float, producer: Callable[[], Any]) -> Any:
+        """Return a cached value for key, producing and storing it on a miss.
+
+        Entries carry their own expiry so negative entries can live shorter
+        than real ones; the cache is size-capped with FIFO eviction.
+        Concurrent misses on the same key are collapsed to one producer
+        call — later callers block on the first caller's future.
+        Exceptions from producer propagate (to all waiters) and are not
+        cached here.
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and now < entry[0]:
+                return entry[1]
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = Future()
+                self._inflight[key] = future
+                is_owner = True
+            else:
+                is_owner = False
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            value = producer()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            self._put(key, value, ttl)
+            future.set_result(value)
+            return value
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
     def get_enhanced_track_info(self, artist: str, track: str) -> Dict[str, Any]:
         """Get enhanced track information from multiple sources."""
         enhanced_info = {
             'artist': artist,
             'track': track,
             'lastfm_data': None,
-            'musicbrainz_data': None
+            'musicbrainz_data': None,
+            'musicbrainz_artist_data': None
         }
-        
-        # Get Last.fm data
+
+        # The two sources are independent; fetch them in parallel so wall
+        # time is the max of the round-trips instead of the sum. The
+        # MusicBrainz side coalesces track + artist-credit into one query.
+        lastfm_future = None
         if LASTFM_API_KEY:
+            lastfm_future = _metadata_pool.submit(self._get_lastfm_track_info, artist, track)
+        mb_future = _metadata_pool.submit(self._get_musicbrainz_track_and_artist, artist, track)
+
+        if lastfm_future is not None:
             try:
-                enhanced_info['lastfm_data'] = self._get_lastfm_track_info(artist, track)
+                enhanced_info['lastfm_data'] = lastfm_future.result(timeout=10)
             except Exception as e:
                 self.logger.error(f"Error fetching Last.fm track info: {e}")
-        
-        # Get MusicBrainz data
+
         try:
-            enhanced_info['musicbrainz_data'] = self._get_musicbrainz_track_info(artist, track)
+            track_info, artist_info = mb_future.result(timeout=10)
+            enhanced_info['musicbrainz_data'] = track_info
+            enhanced_info['musicbrainz_artist_data'] = artist_info
         except Exception as e:
             self.logger.error(f"Error fetching MusicBrainz track info: {e}")
-        
+
         return enhanced_info
     
     def get_enhanced_artist_info(self, artist: str) -> Dict[str, Any]:
@@ -86,118 +289,239 @@ class ExternalMetadataClient:
             'lastfm_data': None,
             'musicbrainz_data': None
         }
-        
-        # Get Last.fm data
+
+        lastfm_future = None
         if LASTFM_API_KEY:
+            lastfm_future = _metadata_pool.submit(self._get_lastfm_artist_info, artist)
+        mb_future = _metadata_pool.submit(self._get_musicbrainz_artist_info, artist)
+
+        if lastfm_future is not None:
             try:
-                enhanced_info['lastfm_data'] = self._get_lastfm_artist_info(artist)
+                enhanced_info['lastfm_data'] = lastfm_future.result(timeout=10)
             except Exception as e:
                 self.logger.error(f"Error fetching Last.fm artist info: {e}")
-        
-        # Get MusicBrainz data  
+
         try:
-            enhanced_info['musicbrainz_data'] = self._get_musicbrainz_artist_info(artist)
+            enhanced_info['musicbrainz_data'] = mb_future.result(timeout=10)
         except Exception as e:
             self.logger.error(f"Error fetching MusicBrainz artist info: {e}")
-        
+
         return enhanced_info
     
+    def get_enhanced_artist_info_batch(self, artists: List[str]) -> List[Dict[str, Any]]:
+        """Get enhanced info for several artists, resolving all of them on
+        MusicBrainz with a single OR-joined query instead of one rate-limited
+        round-trip per name. Last.fm has no batch endpoint, so those lookups
+        run in parallel on the pool."""
+        if not artists:
+            return []
+
+        lastfm_futures = {}
+        if LASTFM_API_KEY:
+            for name in artists:
+                lastfm_futures[name] = _metadata_pool.submit(self._get_lastfm_artist_info, name)
+        mb_future = _metadata_pool.submit(self._get_musicbrainz_artist_info_batch, artists)
+
+        try:
+            mb_by_name = mb_future.result(timeout=10)
+        except Exception as e:
+            self.logger.error(f"Error fetching MusicBrainz artist info: {e}")
+            mb_by_name = {}
+
+        results = []
+        for name in artists:
+            enhanced_info = {
+                'artist': name,
+                'lastfm_data': None,
+                'musicbrainz_data': mb_by_name.get(_norm(name))
+            }
+            future = lastfm_futures.get(name)
+            if future is not None:
+                try:
+                    enhanced_info['lastfm_data'] = future.result(timeout=10)
+                except Exception as e:
+                    self.logger.error(f"Error fetching Last.fm artist info: {e}")
+            results.append(enhanced_info)
+        return results
+
+    def _get_musicbrainz_artist_info_batch(
+        self, artists: List[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Resolve several artists keyed by normalized name, reusing (and
+        backfilling) the per-artist cache so only uncached names hit the API."""
+        now = time.monotonic()
+        by_name: Dict[str, Optional[Dict[str, Any]]] = {}
+        missing = []
+        with self._cache_lock:
+            for name in artists:
+                entry = self._cache.get(('musicbrainz_artist', _norm(name)))
+                if entry is not None and now < entry[0]:
+                    by_name[_norm(name)] = entry[1]
+                else:
+                    missing.append(name)
+
+        if missing:
+            fetched = self._fetch_musicbrainz_artist_info_batch(missing)
+            by_name.update(fetched)
+            for norm_name, info in fetched.items():
+                self._put(('musicbrainz_artist', norm_name), info,
+                          ARTIST_CACHE_TTL)
+        return by_name
+
+    def _fetch_musicbrainz_artist_info_batch(
+        self, artists: List[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        self._respect_musicbrainz_rate_limit()
+
+        # One OR-joined search replaces a rate-limited query per artist; the
+        # best-scored hit whose name matches each input is kept.
+        params = {
+            'query': ' OR '.join(f'artist:"{name}"' for name in artists),
+            'fmt': 'json',
+            'limit': 5 * len(artists)
+        }
+
+        response = self.session.get(f"{MUSICBRAINZ_BASE_URL}artist", params=params)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+        results: Dict[str, Optional[Dict[str, Any]]] = {_norm(name): None for name in artists}
+        for artist_data in data.get('artists', []):
+            key = _norm(artist_data.get('name', ''))
+            if key in results and results[key] is None:
+                results[key] = self._parse_artist(artist_data)
+        return results
+
     def get_similar_artists(self, artist: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get similar artists from Last.fm."""
+        # The offline table needs no API key, so check it before the guard.
+        normalized = _norm(artist)
+        precomputed = _PRECOMPUTED.get(normalized)
+        if precomputed is not None:
+            return precomputed[:limit]
+
         if not LASTFM_API_KEY:
             self.logger.warning("Last.fm API key not configured, cannot get similar artists")
             return []
-        
+
+        key = ('similar_artists', normalized, limit)
         try:
-            params = {
-                'method': 'artist.getsimilar',
-                'artist': artist,
-                'api_key': LASTFM_API_KEY,
-                'format': 'json',
-                'limit': limit
-            }
-            
-            response = self.session.get(LASTFM_BASE_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            if 'similarartists' in data and 'artist' in data['similarartists']:
-                similar = []
-                for similar_artist in data['similarartists']['artist']:
-                    similar.append({
-                        'name': similar_artist.get('name'),
-                        'match_score': float(similar_artist.get('match', 0)),
-                        'url': similar_artist.get('url'),
-                        'image': similar_artist.get('image', [{}])[-1].get('#text') if similar_artist.get('image') and len(similar_artist['image']) > 0 else None
-                    })
-                return similar
-            
-            return []
+            return self._cached(
+                key,
+                ARTIST_CACHE_TTL,
+                lambda: self._fetch_similar_artists(artist, limit),
+            )
         except Exception as e:
             self.logger.error(f"Error getting similar artists: {e}")
+            # Negative-cache the failure briefly so an upstream outage
+            # doesn't cost a rate-limit wait plus round-trip per retry.
+            self._put(key, [], NEGATIVE_CACHE_TTL)
             return []
-    
+
+    def _fetch_similar_artists(self, artist: str, limit: int) -> List[Dict[str, Any]]:
+        self._respect_lastfm_rate_limit()
+
+        url = (
+            f"{_LASTFM_URL_BASE}&method=artist.getsimilar"
+            f"&artist={quote_plus(artist)}&limit={limit}"
+        )
+        response = self.session.get(url)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+        similar_artists = data.get('similarartists', {}).get('artist')
+        if not similar_artists:
+            return []
+
+        similar = []
+        append = similar.append
+        last_image = self._last_image
+        for similar_artist in similar_artists:
+            append({
+                'name': similar_artist.get('name'),
+                'match_score': float(similar_artist.get('match', 0)),
+                'url': similar_artist.get('url'),
+                'image': last_image(similar_artist)
+            })
+        return similar
+
     def _get_lastfm_track_info(self, artist: str, track: str) -> Optional[Dict[str, Any]]:
-        """Get track information from Last.fm."""
-        params = {
-            'method': 'track.getinfo',
-            'api_key': LASTFM_API_KEY,
-            'artist': artist,
-            'track': track,
-            'format': 'json'
-        }
-        
-        response = self.session.get(LASTFM_BASE_URL, params=params)
+        """Get track information from Last.fm (cached)."""
+        return self._cached(
+            ('lastfm_track', _norm(artist), _norm(track)),
+            TRACK_CACHE_TTL,
+            lambda: self._fetch_lastfm_track_info(artist, track),
+        )
+
+    def _fetch_lastfm_track_info(self, artist: str, track: str) -> Optional[Dict[str, Any]]:
+        self._respect_lastfm_rate_limit()
+
+        url = (
+            f"{_LASTFM_URL_BASE}&method=track.getinfo"
+            f"&artist={quote_plus(artist)}&track={quote_plus(track)}"
+        )
+        response = self.session.get(url)
         response.raise_for_status()
-        data = response.json()
-        
-        if 'track' in data:
-            track_data = data['track']
-            return {
-                'name': track_data.get('name'),
-                'artist': track_data.get('artist', {}).get('name'),
-                'album': track_data.get('album', {}).get('title'),
-                'duration': track_data.get('duration'),
-                'listeners': int(track_data.get('listeners', 0)),
-                'playcount': int(track_data.get('playcount', 0)),
-                'tags': [tag['name'] for tag in track_data.get('toptags', {}).get('tag', [])],
-                'url': track_data.get('url'),
-                'wiki': track_data.get('wiki', {}).get('summary')
-            }
+        data = orjson.loads(response.content)
         
-        return None
+        track_data = data.get('track')
+        if track_data is None:
+            return None
+
+        return {
+            'name': track_data.get('name'),
+            'artist': track_data.get('artist', _EMPTY).get('name'),
+            'album': track_data.get('album', _EMPTY).get('title'),
+            'duration': track_data.get('duration'),
+            'listeners': int(track_data.get('listeners', 0)),
+            'playcount': int(track_data.get('playcount', 0)),
+            'tags': [tag['name'] for tag in track_data.get('toptags', _EMPTY).get('tag', ())],
+            'url': track_data.get('url'),
+            'wiki': track_data.get('wiki', _EMPTY).get('summary')
+        }
     
     def _get_lastfm_artist_info(self, artist: str) -> Optional[Dict[str, Any]]:
-        """Get artist information from Last.fm."""
-        params = {
-            'method': 'artist.getinfo',
-            'api_key': LASTFM_API_KEY,
-            'artist': artist,
-            'format': 'json'
-        }
-        
-        response = self.session.get(LASTFM_BASE_URL, params=params)
+        """Get artist information from Last.fm (cached)."""
+        return self._cached(
+            ('lastfm_artist', _norm(artist)),
+            ARTIST_CACHE_TTL,
+            lambda: self._fetch_lastfm_artist_info(artist),
+        )
+
+    def _fetch_lastfm_artist_info(self, artist: str) -> Optional[Dict[str, Any]]:
+        self._respect_lastfm_rate_limit()
+
+        url = f"{_LASTFM_URL_BASE}&method=artist.getinfo&artist={quote_plus(artist)}"
+        response = self.session.get(url)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
-        if 'artist' in data:
-            artist_data = data['artist']
-            return {
-                'name': artist_data.get('name'),
-                'listeners': int(artist_data.get('stats', {}).get('listeners', 0)),
-                'playcount': int(artist_data.get('stats', {}).get('playcount', 0)),
-                'tags': [tag['name'] for tag in artist_data.get('tags', {}).get('tag', [])],
-                'url': artist_data.get('url'),
-                'bio': artist_data.get('bio', {}).get('summary'),
-                'image': artist_data.get('image', [{}])[-1].get('#text') if artist_data.get('image') and len(artist_data['image']) > 0 else None
-            }
-        
-        return None
+        artist_data = data.get('artist')
+        if artist_data is None:
+            return None
+
+        stats = artist_data.get('stats', _EMPTY)
+        return {
+            'name': artist_data.get('name'),
+            'listeners': int(stats.get('listeners', 0)),
+            'playcount': int(stats.get('playcount', 0)),
+            'tags': [tag['name'] for tag in artist_data.get('tags', _EMPTY).get('tag', ())],
+            'url': artist_data.get('url'),
+            'bio': artist_data.get('bio', _EMPTY).get('summary'),
+            'image': self._last_image(artist_data)
+        }
     
     def _get_musicbrainz_track_info(self, artist: str, track: str) -> Optional[Dict[str, Any]]:
-        """Get track information from MusicBrainz."""
+        """Get track information from MusicBrainz (cached)."""
+        return self._cached(
+            ('musicbrainz_track', _norm(artist), _norm(track)),
+            TRACK_CACHE_TTL,
+            lambda: self._fetch_musicbrainz_track_info(artist, track),
+        )
+
+    def _fetch_musicbrainz_track_info(self, artist: str, track: str) -> Optional[Dict[str, Any]]:
         self._respect_musicbrainz_rate_limit()
-        
+
         # Search for recordings
         query = f'recording:"{track}" AND artist:"{artist}"'
         params = {
@@ -205,43 +529,102 @@ class ExternalMetadataClient:
             'fmt': 'json',
             'limit': 5
         }
-        
+
         response = self.session.get(f"{MUSICBRAINZ_BASE_URL}recording", params=params)
         response.raise_for_status()
-        data = response.json()
-        
+        data = orjson.loads(response.content)
+
         if data.get('recordings'):
-            recording = data['recordings'][0]  # Take the first match
-            return {
-                'id': recording.get('id'),
-                'title': recording.get('title'),
-                'length': recording.get('length'),
-                'disambiguation': recording.get('disambiguation'),
-                'artist_credits': [
-                    {
-                        'name': credit.get('name'),
-                        'artist_id': credit.get('artist', {}).get('id')
-                    }
-                    for credit in recording.get('artist-credit', [])
-                    if isinstance(credit, dict)
-                ],
-                'releases': [
-                    {
-                        'id': release.get('id'),
-                        'title': release.get('title'),
-                        'date': release.get('date')
-                    }
-                    for release in recording.get('releases', [])
-                ],
-                'score': recording.get('score')
-            }
-        
+            return self._parse_recording(data['recordings'][0])  # Take the first match
+
         return None
-    
+
+    @staticmethod
+    def _parse_recording(recording: Dict[str, Any]) -> Dict[str, Any]:
+        """Narrow a MusicBrainz recording result to the fields we expose."""
+        return {
+            'id': recording.get('id'),
+            'title': recording.get('title'),
+            'length': recording.get('length'),
+            'disambiguation': recording.get('disambiguation'),
+            'artist_credits': [
+                {
+                    'name': credit.get('name'),
+                    'artist_id': credit.get('artist', {}).get('id')
+                }
+                for credit in recording.get('artist-credit', [])
+                if isinstance(credit, dict)
+            ],
+            'releases': [
+                {
+                    'id': release.get('id'),
+                    'title': release.get('title'),
+                    'date': release.get('date')
+                }
+                for release in recording.get('releases', [])
+            ],
+            'score': recording.get('score')
+        }
+
+    def _get_musicbrainz_track_and_artist(
+        self, artist: str, track: str
+    ) -> tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Get track plus artist-credit info in a single rate-limited query (cached)."""
+        return self._cached(
+            ('musicbrainz_track_artist', _norm(artist), _norm(track)),
+            TRACK_CACHE_TTL,
+            lambda: self._fetch_musicbrainz_track_and_artist(artist, track),
+        )
+
+    def _fetch_musicbrainz_track_and_artist(
+        self, artist: str, track: str
+    ) -> tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        self._respect_musicbrainz_rate_limit()
+
+        # One /recording query with expanded credits replaces separate
+        # /recording and /artist round-trips, each of which would pay the
+        # 1 rps MusicBrainz rate limit.
+        params = {
+            'query': f'recording:"{track}" AND artist:"{artist}"',
+            'fmt': 'json',
+            'limit': 5,
+            'inc': 'artist-credits+releases'
+        }
+
+        response = self.session.get(f"{MUSICBRAINZ_BASE_URL}recording", params=params)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+        if not data.get('recordings'):
+            return None, None
+
+        recording = data['recordings'][0]
+        track_info = self._parse_recording(recording)
+
+        artist_info = None
+        credits = [c for c in recording.get('artist-credit', []) if isinstance(c, dict)]
+        if credits:
+            credit_artist = credits[0].get('artist', {})
+            artist_info = {
+                'id': credit_artist.get('id'),
+                'name': credit_artist.get('name'),
+                'sort_name': credit_artist.get('sort-name'),
+                'disambiguation': credit_artist.get('disambiguation')
+            }
+
+        return track_info, artist_info
+
     def _get_musicbrainz_artist_info(self, artist: str) -> Optional[Dict[str, Any]]:
-        """Get artist information from MusicBrainz."""
+        """Get artist information from MusicBrainz (cached)."""
+        return self._cached(
+            ('musicbrainz_artist', _norm(artist)),
+            ARTIST_CACHE_TTL,
+            lambda: self._fetch_musicbrainz_artist_info(artist),
+        )
+
+    def _fetch_musicbrainz_artist_info(self, artist: str) -> Optional[Dict[str, Any]]:
         self._respect_musicbrainz_rate_limit()
-        
+
         # Search for artists
         params = {
             'query': f'artist:"{artist}"',
@@ -251,29 +634,37 @@ class ExternalMetadataClient:
         
         response = self.session.get(f"{MUSICBRAINZ_BASE_URL}artist", params=params)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         if data.get('artists'):
-            artist_data = data['artists'][0]  # Take the first match
-            return {
-                'id': artist_data.get('id'),
-                'name': artist_data.get('name'),
-                'sort_name': artist_data.get('sort-name'),
-                'type': artist_data.get('type'),
-                'gender': artist_data.get('gender'),
-                'country': artist_data.get('country'),
-                'disambiguation': artist_data.get('disambiguation'),
-                'begin_area': artist_data.get('begin-area', {}).get('name'),
-                'life_span': {
-                    'begin': artist_data.get('life-span', {}).get('begin'),
-                    'end': artist_data.get('life-span', {}).get('end'),
-                    'ended': artist_data.get('life-span', {}).get('ended')
-                },
-                'score': artist_data.get('score')
-            }
-        
+            return self._parse_artist(data['artists'][0])  # Take the first match
+
         return None
+
+    @staticmethod
+    def _parse_artist(artist_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Narrow a MusicBrainz artist result to the fields we expose."""
+        return {
+            'id': artist_data.get('id'),
+            'name': artist_data.get('name'),
+            'sort_name': artist_data.get('sort-name'),
+            'type': artist_data.get('type'),
+            'gender': artist_data.get('gender'),
+            'country': artist_data.get('country'),
+            'disambiguation': artist_data.get('disambiguation'),
+            'begin_area': artist_data.get('begin-area', {}).get('name'),
+            'life_span': {
+                'begin': artist_data.get('life-span', {}).get('begin'),
+                'end': artist_data.get('life-span', {}).get('end'),
+                'ended': artist_data.get('life-span', {}).get('ended')
+            },
+            'score': artist_data.get('score')
+        }
     
     def _respect_musicbrainz_rate_limit(self):
         """Ensure we don't exceed MusicBrainz rate limits (1 request per second)."""
-        _musicbrainz_rate_limiter.wait_if_needed()
\ No newline at end of file
+        _musicbrainz_rate_limiter.wait_if_needed()
+
+    def _respect_lastfm_rate_limit(self):
+        """Ensure we don't exceed Last.fm per-key rate limits."""
+        _lastfm_rate_limiter.wait_if_needed()
\ No newline at end of file
@@ -4,15 +4,16 @@ import os
 import logging
 import sys
 from enum import Enum
-import json
 from typing import List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
 import mcp.types as types
 from mcp.server import NotificationOptions, Server  # , stdio_server
 import mcp.server.stdio
-from pydantic import BaseModel, Field, AnyUrl
+from pydantic import BaseModel, Field, AnyUrl, ValidationError, field_validator
 from spotipy import SpotifyException
 
 from . import spotify_api
@@ -22,16 +23,19 @@ from .external_metadata import ExternalMetadataClient
 # Configuration constants
 EXTERNAL_API_CALL_LIMIT = int(os.getenv("EXTERNAL_API_CALL_LIMIT", "3"))  # Limit external API calls per search
 
-
 def setup_logger():
-    class Logger:
-        def info(self, message):
-            print(f"[INFO] {message}", file=sys.stderr)
+    logger = logging.getLogger("spotify_mcp")
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+        logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    return logger
 
-        def error(self, message):
-            print(f"[ERROR] {message}", file=sys.stderr)
 
-    return Logger()
+def _jsondump(obj) -> str:
+    """Serialize a tool response as pretty-printed JSON via orjson."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
 
 
 logger = setup_logger()
@@ -48,11 +52,19 @@ server = Server("spotify-mcp")
 class ToolModel(BaseModel):
     @classmethod
     def as_tool(cls):
-        return types.Tool(
-            name="Spotify" + cls.__name__,
-            description=cls.__doc__,
-            inputSchema=cls.model_json_schema(),
-        )
+        # model_json_schema() rebuilds the schema dict on every call; the
+        # tool definition is static, so build it once per class and reuse it
+        # for every list_tools round trip. Checked via cls.__dict__ so a
+        # subclass never inherits its parent's cached tool.
+        tool = cls.__dict__.get("_cached_tool")
+        if tool is None:
+            tool = types.Tool(
+                name="Spotify" + cls.__name__,
+                description=cls.__doc__,
+                inputSchema=cls.model_json_schema(),
+            )
+            cls._cached_tool = tool
+        return tool
 
 
 class Playback(ToolModel):
@@ -139,6 +151,15 @@ class Playlist(ToolModel):
         default=0, description="The index of the first track to return (for get_tracks action, useful for pagination)."
     )
 
+    @field_validator("track_ids", mode="before")
+    @classmethod
+    def _decode_track_ids(cls, value):
+        # Clients sometimes send the ID list as a JSON string; decode it here
+        # so validation and parsing happen in one pass.
+        if isinstance(value, str):
+            return orjson.loads(value)
+        return value
+
 
 class Authentication(ToolModel):
     """Check Spotify authentication status.
@@ -190,23 +211,375 @@ async def handle_list_resources() -> list[types.Resource]:
     return []
 
 
+# The tool list is static, so assemble it once at import and return it by
+# reference; list_tools responses are read-only per the MCP contract.
+TOOLS = [
+    model.as_tool()
+    for model in (
+        Playback,
+        Search,
+        Queue,
+        GetInfo,
+        Playlist,
+        Authentication,
+        EnhancedSearch,
+        SimilarArtists,
+    )
+]
+
+
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """List available tools."""
     logger.info("Listing available tools")
     # await server.request_context.session.send_notification("are you recieving this notification?")
-    tools = [
-        Playback.as_tool(),
-        Search.as_tool(),
-        Queue.as_tool(),
-        GetInfo.as_tool(),
-        Playlist.as_tool(),
-        Authentication.as_tool(),
-        EnhancedSearch.as_tool(),
-        SimilarArtists.as_tool(),
-    ]
-    logger.info(f"Available tools: {[tool.name for tool in tools]}")
-    return tools
+    return TOOLS
+
+
+def _text_response(text: str) -> list[types.TextContent]:
+    return [types.TextContent(type="text", text=text)]
+
+
+# Fixed-text responses interned once instead of allocated per call; handler
+# results are treated as read-only by the MCP layer.
+_NO_TRACK_PLAYING = _text_response("No track playing.")
+_PLAYBACK_STARTING = _text_response("Playback starting.")
+_PLAYBACK_PAUSED = _text_response("Playback paused.")
+_TRACK_SKIPPED = _text_response("Skipped to next track.")
+_TRACK_ID_REQUIRED = _text_response("track_id is required for add action")
+_QUEUE_ADDED = _text_response("Track added to queue.")
+_TRACKS_ADDED = _text_response("Tracks added to playlist.")
+_TRACKS_REMOVED = _text_response("Tracks removed from playlist.")
+_DETAILS_CHANGED = _text_response("Playlist details changed.")
+_PLAYLIST_ID_REQUIRED_GET = _text_response("playlist_id is required for get_tracks action.")
+_PLAYLIST_ID_REQUIRED_GET_ALL = _text_response("playlist_id is required for get_all_tracks action.")
+_PLAYLIST_ID_REQUIRED_CHANGE = _text_response("playlist_id is required for change_details action.")
+_DETAILS_FIELD_REQUIRED = _text_response(
+    "At least one of name, description, public, or collaborative is required."
+)
+_ARTIST_REQUIRED = _text_response("Artist name is required for similar artists search")
+
+
+async def _playback_get(args: Playback):
+    logger.info("Attempting to get current track")
+    curr_track = await asyncio.to_thread(spotify_client.get_current_track)
+    if curr_track:
+        logger.info("Current track retrieved: %s", curr_track.get('name', 'Unknown'))
+        return _text_response(_jsondump(curr_track))
+    logger.info("No track currently playing")
+    return _NO_TRACK_PLAYING
+
+
+async def _playback_start(args: Playback):
+    logger.debug("Starting playback with arguments: %s", args)
+    await asyncio.to_thread(spotify_client.start_playback, spotify_uri=args.spotify_uri)
+    logger.info("Playback started successfully")
+    return _PLAYBACK_STARTING
+
+
+async def _playback_pause(args: Playback):
+    logger.info("Attempting to pause playback")
+    await asyncio.to_thread(spotify_client.pause_playback)
+    logger.info("Playback paused successfully")
+    return _PLAYBACK_PAUSED
+
+
+async def _playback_skip(args: Playback):
+    num_skips = args.num_skips
+    logger.info("Skipping %s tracks.", num_skips)
+    await asyncio.to_thread(spotify_client.skip_track, n=num_skips)
+    return _TRACK_SKIPPED
+
+
+async def _playback_unknown(args: Playback):
+    action = args.action
+    return _text_response(
+        f"Unknown playback action: {action}. Supported actions are: get, start, pause and skip."
+    )
+
+
+async def _search(args: Search):
+    logger.debug("Performing search with arguments: %s", args)
+    search_results = await asyncio.to_thread(
+        spotify_client.search,
+        query=args.query,
+        qtype=args.qtype,
+        limit=args.limit,
+    )
+    logger.info("Search completed successfully.")
+    return _text_response(_jsondump(search_results))
+
+
+async def _queue_add(args: Queue):
+    logger.debug("Queue operation with arguments: %s", args)
+    track_id = args.track_id
+    if not track_id:
+        logger.error("track_id is required for add to queue.")
+        return _TRACK_ID_REQUIRED
+    await asyncio.to_thread(spotify_client.add_to_queue, track_id)
+    return _QUEUE_ADDED
+
+
+async def _queue_get(args: Queue):
+    logger.debug("Queue operation with arguments: %s", args)
+    queue = await asyncio.to_thread(spotify_client.get_queue)
+    return _text_response(_jsondump(queue))
+
+
+async def _queue_unknown(args: Queue):
+    action = args.action
+    return _text_response(
+        f"Unknown queue action: {action}. Supported actions are: add, remove, and get."
+    )
+
+
+async def _get_info(args: GetInfo):
+    logger.debug("Getting item info with arguments: %s", args)
+    item_info = await asyncio.to_thread(spotify_client.get_info, item_uri=args.item_uri)
+    return _text_response(_jsondump(item_info))
+
+
+async def _playlist_get(args: Playlist):
+    logger.debug("Getting current user's playlists with arguments: %s", args)
+    playlists = await asyncio.to_thread(spotify_client.get_current_user_playlists)
+    return _text_response(_jsondump(playlists))
+
+
+async def _playlist_get_tracks(args: Playlist):
+    logger.debug("Getting tracks in playlist with arguments: %s", args)
+    if not args.playlist_id:
+        logger.error("playlist_id is required for get_tracks action.")
+        return _PLAYLIST_ID_REQUIRED_GET
+    tracks = await asyncio.to_thread(
+        spotify_client.get_playlist_tracks,
+        playlist_id=args.playlist_id,
+        limit=args.limit,
+        offset=args.offset,
+    )
+    return _text_response(_jsondump(tracks))
+
+
+async def _playlist_get_all_tracks(args: Playlist):
+    logger.debug("Getting ALL tracks from playlist with arguments: %s", args)
+    playlist_id = args.playlist_id
+    if not playlist_id:
+        logger.error("playlist_id is required for get_all_tracks action.")
+        return _PLAYLIST_ID_REQUIRED_GET_ALL
+    # Emit the export as NDJSON: one TextContent per page (header first,
+    # then 100-track pages). The response still holds every encoded page,
+    # but only one page is ever parsed at a time and the compact per-page
+    # dumps replace the old indent=2 blob that existed alongside the full
+    # parsed track list. The paginated fetch is synchronous spotipy I/O,
+    # so the whole walk runs off the event loop.
+    def _collect_pages():
+        return [
+            types.TextContent(type="text", text=orjson.dumps(page).decode() + "\n")
+            for page in spotify_client.iter_playlist_track_pages(playlist_id)
+        ]
+
+    return await asyncio.to_thread(_collect_pages)
+
+
+async def _playlist_add_tracks(args: Playlist):
+    logger.debug("Adding tracks to playlist with arguments: %s", args)
+    await asyncio.to_thread(
+        spotify_client.add_tracks_to_playlist,
+        playlist_id=args.playlist_id,
+        track_ids=args.track_ids,
+    )
+    return _TRACKS_ADDED
+
+
+async def _playlist_remove_tracks(args: Playlist):
+    logger.debug("Removing tracks from playlist with arguments: %s", args)
+    await asyncio.to_thread(
+        spotify_client.remove_tracks_from_playlist,
+        playlist_id=args.playlist_id,
+        track_ids=args.track_ids,
+    )
+    return _TRACKS_REMOVED
+
+
+async def _playlist_change_details(args: Playlist):
+    logger.debug("Changing playlist details with arguments: %s", args)
+    playlist_id = args.playlist_id
+    name = args.name
+    description = args.description
+    if not playlist_id:
+        logger.error("playlist_id is required for change_details action.")
+        return _PLAYLIST_ID_REQUIRED_CHANGE
+    if not name and not description:
+        logger.error("At least one of name, description or public is required.")
+        return _DETAILS_FIELD_REQUIRED
+    await asyncio.to_thread(
+        spotify_client.change_playlist_details,
+        playlist_id=playlist_id,
+        name=name,
+        description=description,
+    )
+    return _DETAILS_CHANGED
+
+
+async def _playlist_unknown(args: Playlist):
+    action = args.action
+    return _text_response(
+        f"Unknown playlist action: {action}. "
+        "Supported actions are: get, get_tracks, get_all_tracks, add_tracks, remove_tracks, change_details."
+    )
+
+
+async def _auth_check(args: Authentication):
+    logger.info("Checking authentication status")
+    status = await asyncio.to_thread(spotify_client.check_auth)
+    return _text_response(f"Authentication status: {status}")
+
+
+async def _auth_unknown(args: Authentication):
+    action = args.action
+    return _text_response(
+        f"Unknown authentication action: {action}. Only 'check_auth' is supported. "
+        "To authenticate, run 'python auth.py' from the command line."
+    )
+
+
+async def _enhanced_search(args: EnhancedSearch):
+    logger.debug("Enhanced search with arguments: %s", args)
+    query = args.query
+    search_type = args.search_type
+    include_similar = args.include_similar
+    limit = args.limit
+
+    # First, get Spotify search results
+    spotify_results = await asyncio.to_thread(
+        spotify_client.search,
+        query=query,
+        qtype=search_type,
+        limit=limit,
+    )
+
+    enhanced_results = {
+        "query": query,
+        "search_type": search_type,
+        "spotify_results": spotify_results,
+        "external_metadata": []
+    }
+
+    # Enhance each result with external metadata. The lookups are
+    # network-bound HTTP calls, so they run concurrently on worker
+    # threads instead of serially; fan-out is already bounded by
+    # the EXTERNAL_API_CALL_LIMIT slice.
+    if search_type == "track" and spotify_results.get("tracks"):
+        outcomes = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    external_metadata_client.get_enhanced_track_info,
+                    track.get("artist", ""),
+                    track.get("name", ""),
+                )
+                for track in spotify_results["tracks"][:EXTERNAL_API_CALL_LIMIT]
+            ),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.error("Error enhancing track metadata: %s", outcome)
+            else:
+                enhanced_results["external_metadata"].append(outcome)
+
+    elif search_type == "artist" and spotify_results.get("artists"):
+        names = [
+            artist.get("name", "")
+            for artist in spotify_results["artists"][:EXTERNAL_API_CALL_LIMIT]
+        ]
+        try:
+            # One batched call resolves every artist on MusicBrainz with a
+            # single query; similar-artist lookups fan out alongside it.
+            if include_similar:
+                infos, *similar_lists = await asyncio.gather(
+                    asyncio.to_thread(
+                        external_metadata_client.get_enhanced_artist_info_batch,
+                        names,
+                    ),
+                    *(
+                        asyncio.to_thread(
+                            external_metadata_client.get_similar_artists, name, 5
+                        )
+                        for name in names
+                    ),
+                )
+                for info, similar in zip(infos, similar_lists):
+                    info["similar_artists"] = similar
+            else:
+                infos = await asyncio.to_thread(
+                    external_metadata_client.get_enhanced_artist_info_batch,
+                    names,
+                )
+            enhanced_results["external_metadata"].extend(infos)
+        except Exception as e:
+            logger.error("Error enhancing artist metadata: %s", e)
+
+    return _text_response(_jsondump(enhanced_results))
+
+
+async def _similar_artists(args: SimilarArtists):
+    logger.debug("Getting similar artists with arguments: %s", args)
+    artist = args.artist
+    limit = args.limit
+
+    if not artist:
+        return _ARTIST_REQUIRED
+
+    similar_artists = await asyncio.to_thread(
+        external_metadata_client.get_similar_artists, artist, limit
+    )
+
+    result = {
+        "artist": artist,
+        "similar_artists": similar_artists,
+        "count": len(similar_artists)
+    }
+
+    return _text_response(_jsondump(result))
+
+
+# Tool name -> argument model; incoming arguments are validated once through
+# pydantic's compiled validator before dispatch.
+TOOL_MODELS = {
+    "Playback": Playback,
+    "Search": Search,
+    "Queue": Queue,
+    "GetInfo": GetInfo,
+    "Playlist": Playlist,
+    "Authentication": Authentication,
+    "EnhancedSearch": EnhancedSearch,
+    "SimilarArtists": SimilarArtists,
+}
+
+# (tool, action) -> handler. Entries keyed with action None are the whole-tool
+# handlers for action-less tools and the unknown-action fallbacks for the rest.
+DISPATCH = {
+    ("Playback", "get"): _playback_get,
+    ("Playback", "start"): _playback_start,
+    ("Playback", "pause"): _playback_pause,
+    ("Playback", "skip"): _playback_skip,
+    ("Playback", None): _playback_unknown,
+    ("Search", None): _search,
+    ("Queue", "add"): _queue_add,
+    ("Queue", "get"): _queue_get,
+    ("Queue", None): _queue_unknown,
+    ("GetInfo", None): _get_info,
+    ("Playlist", "get"): _playlist_get,
+    ("Playlist", "get_tracks"): _playlist_get_tracks,
+    ("Playlist", "get_all_tracks"): _playlist_get_all_tracks,
+    ("Playlist", "add_tracks"): _playlist_add_tracks,
+    ("Playlist", "remove_tracks"): _playlist_remove_tracks,
+    ("Playlist", "change_details"): _playlist_change_details,
+    ("Playlist", None): _playlist_unknown,
+    ("Authentication", "check_auth"): _auth_check,
+    ("Authentication", None): _auth_unknown,
+    ("EnhancedSearch", None): _enhanced_search,
+    ("SimilarArtists", None): _similar_artists,
+}
 
 
 @server.call_tool()
@@ -214,395 +587,38 @@ async def handle_call_tool(
     name: str, arguments: dict | None
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
     """Handle tool execution requests."""
-    logger.info(f"Tool called: {name} with arguments: {arguments}")
-    assert name[:7] == "Spotify", f"Unknown tool: {name}"
+    logger.info("Tool called: %s", name)
+    logger.debug("Tool arguments: %s", arguments)
+    # removeprefix checks and strips in one pass, returning the original
+    # object unchanged when the prefix is missing.
+    tool = name.removeprefix("Spotify")
+    assert tool is not name, f"Unknown tool: {name}"
+    model = TOOL_MODELS.get(tool)
+    if model is None:
+        error_msg = f"Unknown tool: {name}"
+        logger.error(error_msg)
+        return _text_response(error_msg)
     try:
-        match name[7:]:
-            case "Playback":
-                action = arguments.get("action")
-                match action:
-                    case "get":
-                        logger.info("Attempting to get current track")
-                        curr_track = spotify_client.get_current_track()
-                        if curr_track:
-                            logger.info(
-                                f"Current track retrieved: {curr_track.get('name', 'Unknown')}"
-                            )
-                            return [
-                                types.TextContent(
-                                    type="text", text=json.dumps(curr_track, indent=2)
-                                )
-                            ]
-                        logger.info("No track currently playing")
-                        return [
-                            types.TextContent(type="text", text="No track playing.")
-                        ]
-                    case "start":
-                        logger.info(f"Starting playback with arguments: {arguments}")
-                        spotify_client.start_playback(
-                            spotify_uri=arguments.get("spotify_uri")
-                        )
-                        logger.info("Playback started successfully")
-                        return [
-                            types.TextContent(type="text", text="Playback starting.")
-                        ]
-                    case "pause":
-                        logger.info("Attempting to pause playback")
-                        spotify_client.pause_playback()
-                        logger.info("Playback paused successfully")
-                        return [types.TextContent(type="text", text="Playback paused.")]
-                    case "skip":
-                        num_skips = int(arguments.get("num_skips", 1))
-                        logger.info(f"Skipping {num_skips} tracks.")
-                        spotify_client.skip_track(n=num_skips)
-                        return [
-                            types.TextContent(
-                                type="text", text="Skipped to next track."
-                            )
-                        ]
-
-            case "Search":
-                logger.info(f"Performing search with arguments: {arguments}")
-                search_results = spotify_client.search(
-                    query=arguments.get("query", ""),
-                    qtype=arguments.get("qtype", "track"),
-                    limit=arguments.get("limit", 10),
-                )
-                logger.info("Search completed successfully.")
-                return [
-                    types.TextContent(
-                        type="text", text=json.dumps(search_results, indent=2)
-                    )
-                ]
-
-            case "Queue":
-                logger.info(f"Queue operation with arguments: {arguments}")
-                action = arguments.get("action")
-
-                match action:
-                    case "add":
-                        track_id = arguments.get("track_id")
-                        if not track_id:
-                            logger.error("track_id is required for add to queue.")
-                            return [
-                                types.TextContent(
-                                    type="text",
-                                    text="track_id is required for add action",
-                                )
-                            ]
-                        spotify_client.add_to_queue(track_id)
-                        return [
-                            types.TextContent(
-                                type="text", text=f"Track added to queue."
-                            )
-                        ]
-
-                    case "get":
-                        queue = spotify_client.get_queue()
-                        return [
-                            types.TextContent(
-                                type="text", text=json.dumps(queue, indent=2)
-                            )
-                        ]
-
-                    case _:
-                        return [
-                            types.TextContent(
-                                type="text",
-                                text=f"Unknown queue action: {action}. Supported actions are: add, remove, and get.",
-                            )
-                        ]
-
-            case "GetInfo":
-                logger.info(f"Getting item info with arguments: {arguments}")
-                item_info = spotify_client.get_info(item_uri=arguments.get("item_uri"))
-                return [
-                    types.TextContent(type="text", text=json.dumps(item_info, indent=2))
-                ]
-
-            case "Playlist":
-                logger.info(f"Playlist operation with arguments: {arguments}")
-                action = arguments.get("action")
-                match action:
-                    case "get":
-                        logger.info(
-                            f"Getting current user's playlists with arguments: {arguments}"
-                        )
-                        playlists = spotify_client.get_current_user_playlists()
-                        return [
-                            types.TextContent(
-                                type="text", text=json.dumps(playlists, indent=2)
-                            )
-                        ]
-                    case "get_tracks":
-                        logger.info(
-                            f"Getting tracks in playlist with arguments: {arguments}"
-                        )
-                        if not arguments.get("playlist_id"):
-                            logger.error(
-                                "playlist_id is required for get_tracks action."
-                            )
-                            return [
-                                types.TextContent(
-                                    type="text",
-                                    text="playlist_id is required for get_tracks action.",
-                                )
-                            ]
-                        tracks = spotify_client.get_playlist_tracks(
-                            playlist_id=arguments.get("playlist_id"),
-                            limit=arguments.get("limit", 50),
-                            offset=arguments.get("offset", 0)
-                        )
-                        return [
-                            types.TextContent(
-                                type="text", text=json.dumps(tracks, indent=2)
-                            )
-                        ]
-                    case "get_all_tracks":
-                        logger.info(
-                            f"Getting ALL tracks from playlist with arguments: {arguments}"
-                        )
-                        if not arguments.get("playlist_id"):
-                            logger.error(
-                                "playlist_id is required for get_all_tracks action."
-                            )
-                            return [
-                                types.TextContent(
-                                    type="text",
-                                    text="playlist_id is required for get_all_tracks action.",
-                                )
-                            ]
-                        playlist_data = spotify_client.get_all_playlist_tracks(
-                            playlist_id=arguments.get("playlist_id")
-                        )
-                        return [
-                            types.TextContent(
-                                type="text", text=json.dumps(playlist_data, indent=2)
-                            )
-                        ]
-                    case "add_tracks":
-                        logger.info(
-                            f"Adding tracks to playlist with arguments: {arguments}"
-                        )
-                        track_ids = arguments.get("track_ids")
-                        if isinstance(track_ids, str):
-                            try:
-                                track_ids = json.loads(
-                                    track_ids
-                                )  # Convert JSON string to Python list
-                            except json.JSONDecodeError:
-                                logger.error(
-                                    "track_ids must be a list or a valid JSON array."
-                                )
-                                return [
-                                    types.TextContent(
-                                        type="text",
-                                        text="Error: track_ids must be a list or a valid JSON array.",
-                                    )
-                                ]
-
-                        spotify_client.add_tracks_to_playlist(
-                            playlist_id=arguments.get("playlist_id"),
-                            track_ids=track_ids,
-                        )
-                        return [
-                            types.TextContent(
-                                type="text", text="Tracks added to playlist."
-                            )
-                        ]
-                    case "remove_tracks":
-                        logger.info(
-                            f"Removing tracks from playlist with arguments: {arguments}"
-                        )
-                        track_ids = arguments.get("track_ids")
-                        if isinstance(track_ids, str):
-                            try:
-                                track_ids = json.loads(
-                                    track_ids
-                                )  # Convert JSON string to Python list
-                            except json.JSONDecodeError:
-                                logger.error(
-                                    "track_ids must be a list or a valid JSON array."
-                                )
-                                return [
-                                    types.TextContent(
-                                        type="text",
-                                        text="Error: track_ids must be a list or a valid JSON array.",
-                                    )
-                                ]
-
-                        spotify_client.remove_tracks_from_playlist(
-                            playlist_id=arguments.get("playlist_id"),
-                            track_ids=track_ids,
-                        )
-                        return [
-                            types.TextContent(
-                                type="text", text="Tracks removed from playlist."
-                            )
-                        ]
-
-                    case "change_details":
-                        logger.info(
-                            f"Changing playlist details with arguments: {arguments}"
-                        )
-                        if not arguments.get("playlist_id"):
-                            logger.error(
-                                "playlist_id is required for change_details action."
-                            )
-                            return [
-                                types.TextContent(
-                                    type="text",
-                                    text="playlist_id is required for change_details action.",
-                                )
-                            ]
-                        if not arguments.get("name") and not arguments.get(
-                            "description"
-                        ):
-                            logger.error(
-                                "At least one of name, description or public is required."
-                            )
-                            return [
-                                types.TextContent(
-                                    type="text",
-                                    text="At least one of name, description, public, or collaborative is required.",
-                                )
-                            ]
-
-                        spotify_client.change_playlist_details(
-                            playlist_id=arguments.get("playlist_id"),
-                            name=arguments.get("name"),
-                            description=arguments.get("description"),
-                        )
-                        return [
-                            types.TextContent(
-                                type="text", text="Playlist details changed."
-                            )
-                        ]
-
-                    case _:
-                        return [
-                            types.TextContent(
-                                type="text",
-                                text=f"Unknown playlist action: {action}. "
-                                "Supported actions are: get, get_tracks, get_all_tracks, add_tracks, remove_tracks, change_details.",
-                            )
-                        ]
-            case "Authentication":
-                logger.info(f"Authentication operation with arguments: {arguments}")
-                action = arguments.get("action")
-                match action:
-                    case "check_auth":
-                        logger.info("Checking authentication status")
-                        status = spotify_client.check_auth()
-                        return [
-                            types.TextContent(
-                                type="text", text=f"Authentication status: {status}"
-                            )
-                        ]
-                    case _:
-                        return [
-                            types.TextContent(
-                                type="text",
-                                text=f"Unknown authentication action: {action}. Only 'check_auth' is supported. To authenticate, run 'python auth.py' from the command line.",
-                            )
-                        ]
-            
-            case "EnhancedSearch":
-                logger.info(f"Enhanced search with arguments: {arguments}")
-                query = arguments.get("query", "")
-                search_type = arguments.get("search_type", "track")
-                include_similar = arguments.get("include_similar", True)
-                limit = arguments.get("limit", 5)
-                
-                # First, get Spotify search results
-                spotify_results = spotify_client.search(
-                    query=query,
-                    qtype=search_type,
-                    limit=limit
-                )
-                
-                enhanced_results = {
-                    "query": query,
-                    "search_type": search_type,
-                    "spotify_results": spotify_results,
-                    "external_metadata": []
-                }
-                
-                # Enhance each result with external metadata
-                if search_type == "track" and spotify_results.get("tracks"):
-                    for track in spotify_results["tracks"][:EXTERNAL_API_CALL_LIMIT]:
-                        try:
-                            enhanced_info = external_metadata_client.get_enhanced_track_info(
-                                track.get("artist", ""), track.get("name", "")
-                            )
-                            enhanced_results["external_metadata"].append(enhanced_info)
-                        except Exception as e:
-                            logger.error(f"Error enhancing track metadata: {e}")
-                
-                elif search_type == "artist" and spotify_results.get("artists"):
-                    for artist in spotify_results["artists"][:EXTERNAL_API_CALL_LIMIT]:
-                        try:
-                            enhanced_info = external_metadata_client.get_enhanced_artist_info(
-                                artist.get("name", "")
-                            )
-                            # Add similar artists if requested
-                            if include_similar:
-                                enhanced_info["similar_artists"] = external_metadata_client.get_similar_artists(
-                                    artist.get("name", ""), limit=5
-                                )
-                            enhanced_results["external_metadata"].append(enhanced_info)
-                        except Exception as e:
-                            logger.error(f"Error enhancing artist metadata: {e}")
-                
-                return [
-                    types.TextContent(
-                        type="text", text=json.dumps(enhanced_results, indent=2)
-                    )
-                ]
-            
-            case "SimilarArtists":
-                logger.info(f"Getting similar artists with arguments: {arguments}")
-                artist = arguments.get("artist", "")
-                limit = arguments.get("limit", 10)
-                
-                if not artist:
-                    return [
-                        types.TextContent(
-                            type="text", text="Artist name is required for similar artists search"
-                        )
-                    ]
-                
-                similar_artists = external_metadata_client.get_similar_artists(artist, limit)
-                
-                result = {
-                    "artist": artist,
-                    "similar_artists": similar_artists,
-                    "count": len(similar_artists)
-                }
-                
-                return [
-                    types.TextContent(
-                        type="text", text=json.dumps(result, indent=2)
-                    )
-                ]
-            
-            case _:
-                error_msg = f"Unknown tool: {name}"
-                logger.error(error_msg)
-                return [types.TextContent(type="text", text=error_msg)]
+        try:
+            args = model.model_validate(arguments or {})
+        except ValidationError as e:
+            logger.error("Invalid arguments for %s: %s", name, e)
+            return _text_response(f"Invalid arguments for {name}: {e}")
+        handler = (
+            DISPATCH.get((tool, getattr(args, "action", None)))
+            or DISPATCH.get((tool, None))
+        )
+        return await handler(args)
     except SpotifyException as se:
         error_msg = f"Spotify Client error occurred: {str(se)}"
         logger.error(error_msg)
-        return [
-            types.TextContent(
-                type="text",
-                text=f"An error occurred with the Spotify Client: {str(se)}",
-            )
-        ]
+        return _text_response(
+            f"An error occurred with the Spotify Client: {str(se)}"
+        )
     except Exception as e:
         error_msg = f"Unexpected error occurred: {str(e)}"
         logger.error(error_msg)
-        return [types.TextContent(type="text", text=error_msg)]
+        return _text_response(error_msg)
 
 
 async def main():
@@ -612,5 +628,7 @@ async def main():
                 read_stream, write_stream, server.create_initialization_options()
             )
     except Exception as e:
-        logger.error(f"Server error occurred: {str(e)}")
+        logger.error("Server error occurred: %s", e)
         raise
+    finally:
+        external_metadata_client.close()
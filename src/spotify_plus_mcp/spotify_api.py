@@ -1,27 +1,73 @@
+import atexit
+import copy
+import hashlib
 import logging
 import os
 import json
 import requests
 import base64
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List
 from urllib.parse import urlencode, parse_qs, urlparse
 
+import orjson
 import spotipy
-from dotenv import load_dotenv
 from spotipy.cache_handler import CacheFileHandler
 from spotipy.oauth2 import SpotifyOAuth
 
 from . import utils
 
-load_dotenv()
-
 # Config file location
 CONFIG_DIR = Path.home() / ".spotify-plus-mcp"
 CONFIG_FILE = CONFIG_DIR / "spotify-config.json"
 
+# Parsed config keyed by path -> (st_mtime_ns, dict); avoids re-reading and
+# re-parsing the file for every Client construction in the same process.
+_CONFIG_CACHE: Dict[Path, tuple] = {}
+
+TOKEN_URL = "https://accounts.spotify.com/api/token"
+
+# Shared pool for fanning out independent Spotify API round-trips.
+# Created lazily so importing the module never spawns threads, and torn
+# down at interpreter exit.
+_IO_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def _get_io_pool() -> ThreadPoolExecutor:
+    global _IO_POOL
+    if _IO_POOL is None:
+        _IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="spotify-io")
+        atexit.register(_IO_POOL.shutdown, wait=False)
+    return _IO_POOL
+
+# Playlist pagination: pages kept in flight at once, and retries per page.
+_PAGE_FETCH_WINDOW = 4
+_PAGE_MAX_RETRIES = 3
+
+# Server-side projection for playlist track pages: the default payload
+# carries available_markets arrays and full album objects that
+# utils.parse_track never reads, so ask Spotify for just the fields the
+# parser consumes.
+TRACK_FIELDS = "items(track(id,name,is_playable,artists(name))),total"
+
+# How long a current-track lookup stays fresh; tight call sequences like
+# start_playback -> is_track_playing -> get_current_track reuse one fetch.
+_CURRENT_TRACK_TTL = 0.5
+
+# Spotify's playlist modify endpoints accept at most 100 IDs per call.
+_PLAYLIST_MUTATE_CHUNK = 100
+
+# Device list freshness window; validator chains often need it twice in a row.
+_DEVICES_TTL = 1.0
+
+# (connect, read) timeout for token endpoint calls.
+_TOKEN_TIMEOUT = (3.05, 10.0)
+
 CLIENT_ID = os.getenv("SPOTIFY_CLIENT_ID")
 CLIENT_SECRET = os.getenv("SPOTIFY_CLIENT_SECRET")
 REDIRECT_URI = os.getenv("SPOTIFY_REDIRECT_URI")
@@ -33,7 +79,7 @@ if REDIRECT_URI:
 SCOPES = [
     "user-read-currently-playing",
     "user-read-playback-state",
-    "user-read-currently-playing",  # spotify connect
+    "user-modify-playback-state",  # spotify connect
     "app-remote-control",
     "streaming",  # playback
     "playlist-read-private",
@@ -48,29 +94,95 @@ SCOPES = [
     "user-library-read",  # library
 ]
 
+# The scope set is static, so join it once at import; sorted(set(...)) also
+# guards against duplicate entries drifting back into SCOPES.
+_SCOPE_STR = ",".join(sorted(set(SCOPES)))
+
+# spotipy.Spotify instances keyed by access token. Each instance owns a
+# requests.Session, so reusing one across Client constructions and
+# re-inits keeps the connection pool to api.spotify.com warm.
+_SP_CACHE: Dict[str, spotipy.Spotify] = {}
+
+
+def _spotify_for_token(access_token: str) -> spotipy.Spotify:
+    """Return a (cached) spotipy client bound to the given access token."""
+    sp = _SP_CACHE.get(access_token)
+    if sp is None:
+        sp = spotipy.Spotify(auth=access_token)
+        _SP_CACHE.clear()  # old tokens are dead weight; keep only the current one
+        _SP_CACHE[access_token] = sp
+    return sp
+
 
 class Client:
     def __init__(self, logger: logging.Logger):
         """Initialize Spotify client with necessary permissions"""
         self.logger = logger
+        self._expires_at_epoch: Optional[float] = None
+        # Digest of the last config bytes written, for the no-op save guard.
+        self._last_config_hash: Optional[bytes] = None
         self.config = self._load_config()
+        self._cache_expiry_epoch()
         self.sp = None
         self.username = None
+        # Shared session so repeated token refreshes reuse one keep-alive
+        # connection to accounts.spotify.com instead of a TLS handshake each.
+        self._http = requests.Session()
+        self._http.mount(
+            'https://', requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4)
+        )
+        self._basic_auth_header = None
+        # (fetched_at_monotonic, track_info) memo for get_current_track.
+        self._current_track_cache: Optional[tuple] = None
+        # (fetched_at_monotonic, devices) memo for get_devices.
+        self._devices_cache: Optional[tuple] = None
+        # The current_user record is stable for a token's lifetime.
+        self._current_user: Optional[Dict] = None
+        # Bound once so get_info dispatch is a dict lookup, not match/case.
+        self._info_handlers = {
+            "track": self._info_track,
+            "album": self._info_album,
+            "artist": self._info_artist,
+            "playlist": self._info_playlist,
+        }
         self._init_spotify_client()
 
+    def _token_headers(self) -> Optional[Dict[str, str]]:
+        """Headers for token endpoint calls, with the Basic-auth value
+        base64-encoded once per process instead of per refresh."""
+        if self._basic_auth_header is None:
+            client_id = self.config.get("client_id") or CLIENT_ID
+            client_secret = self.config.get("client_secret") or CLIENT_SECRET
+            if not client_id or not client_secret:
+                return None
+            auth_b64 = base64.b64encode(
+                f"{client_id}:{client_secret}".encode('ascii')
+            ).decode('ascii')
+            self._basic_auth_header = f"Basic {auth_b64}"
+        return {
+            "Authorization": self._basic_auth_header,
+            "Content-Type": "application/x-www-form-urlencoded"
+        }
+
     def _load_config(self) -> Dict:
         """Load configuration from file or create default."""
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        
+
         if CONFIG_FILE.exists():
             try:
-                with open(CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
-                    self.logger.info(f"Loaded config from {CONFIG_FILE}")
-                    return config
+                # Skip re-parsing when the file hasn't changed since the last
+                # load; each Client gets its own copy so mutations stay local.
+                mtime_ns = os.stat(CONFIG_FILE).st_mtime_ns
+                cached = _CONFIG_CACHE.get(CONFIG_FILE)
+                if cached is not None and cached[0] == mtime_ns:
+                    return copy.deepcopy(cached[1])
+                config = json.loads(CONFIG_FILE.read_bytes())
+                _CONFIG_CACHE[CONFIG_FILE] = (mtime_ns, copy.deepcopy(config))
+                self.logger.info(f"Loaded config from {CONFIG_FILE}")
+                return config
             except Exception as e:
                 self.logger.error(f"Error loading config: {e}")
-        
+
         # Create default config
         config = {
             "client_id": CLIENT_ID or "",
@@ -84,29 +196,39 @@ class Client:
         return config
     
     def _save_config(self, config: Dict = None):
-        """Save configuration to file."""
+        """Save configuration to file atomically, skipping no-op writes."""
         if config is None:
             config = self.config
         try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=2)
+            data = json.dumps(config, indent=2).encode()
+            digest = hashlib.blake2b(data, digest_size=8).digest()
+            if digest == self._last_config_hash:
+                return
+            tmp_file = CONFIG_FILE.with_suffix('.json.tmp')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, CONFIG_FILE)
+            self._last_config_hash = digest
+            # Refresh the cache entry so the next load is a pure dict copy.
+            _CONFIG_CACHE[CONFIG_FILE] = (
+                os.stat(CONFIG_FILE).st_mtime_ns, copy.deepcopy(config)
+            )
             self.logger.info(f"Saved config to {CONFIG_FILE}")
         except Exception as e:
             self.logger.error(f"Error saving config: {e}")
     
     def _init_spotify_client(self):
         """Initialize Spotify client with stored or new tokens."""
-        scope = "user-library-read,user-read-playback-state,user-modify-playback-state,user-read-currently-playing,playlist-read-private,playlist-read-collaborative,playlist-modify-private,playlist-modify-public"
-        
+        scope = _SCOPE_STR
+
         # Check if we have stored tokens
         if self.config.get("access_token") and not self._is_token_expired():
             # Use stored access token directly
-            self.sp = spotipy.Spotify(auth=self.config["access_token"])
+            self.sp = _spotify_for_token(self.config["access_token"])
             self.logger.info("Using stored access token")
         elif self.config.get("refresh_token"):
             # Try to refresh the token
             if self._refresh_token():
-                self.sp = spotipy.Spotify(auth=self.config["access_token"])
+                self.sp = _spotify_for_token(self.config["access_token"])
                 self.logger.info("Refreshed and using new access token")
             else:
                 # Fall back to OAuth flow
@@ -132,52 +254,44 @@ class Client:
             self.logger.error(f"Failed to initialize Spotify client: {str(e)}")
             raise
     
-    def _is_token_expired(self) -> bool:
-        """Check if the stored access token has expired."""
+    def _cache_expiry_epoch(self):
+        """Parse the stored expiry timestamp once so checks stay scalar."""
         expires_at = self.config.get("expires_at")
         if not expires_at:
-            return True
+            self._expires_at_epoch = None
+            return
         try:
-            expiry_time = datetime.fromisoformat(expires_at)
-            return datetime.now() >= expiry_time
-        except:
-            return True
+            self._expires_at_epoch = datetime.fromisoformat(expires_at).timestamp()
+        except Exception:
+            self._expires_at_epoch = None
+
+    def _is_token_expired(self) -> bool:
+        """Check if the stored access token has expired."""
+        return self._expires_at_epoch is None or time.time() >= self._expires_at_epoch
     
     def _refresh_token(self) -> bool:
         """Refresh the access token using the refresh token."""
         refresh_token = self.config.get("refresh_token")
         if not refresh_token:
             return False
-        
-        client_id = self.config.get("client_id") or CLIENT_ID
-        client_secret = self.config.get("client_secret") or CLIENT_SECRET
-        
-        if not client_id or not client_secret:
+
+        headers = self._token_headers()
+        if headers is None:
             return False
-        
-        # Prepare the request
-        auth_str = f"{client_id}:{client_secret}"
-        auth_bytes = auth_str.encode('ascii')
-        auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
-        
-        headers = {
-            "Authorization": f"Basic {auth_b64}",
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
-        
+
         data = {
             "grant_type": "refresh_token",
             "refresh_token": refresh_token
         }
         
         try:
-            response = requests.post("https://accounts.spotify.com/api/token", headers=headers, data=data)
+            response = self._http.post(TOKEN_URL, headers=headers, data=data, timeout=_TOKEN_TIMEOUT)
             
             if response.status_code != 200:
                 self.logger.error(f"Token refresh failed: {response.text}")
                 return False
             
-            token_info = response.json()
+            token_info = orjson.loads(response.content)
             
             # Update stored tokens
             self.config["access_token"] = token_info["access_token"]
@@ -188,8 +302,10 @@ class Client:
             expires_in = token_info.get("expires_in", 3600)
             expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
             self.config["expires_at"] = expires_at.isoformat()
-            
+            self._expires_at_epoch = expires_at.timestamp()
+
             self._save_config()
+            self._current_user = None
             self.logger.info("Successfully refreshed access token")
             return True
             
@@ -204,7 +320,14 @@ class Client:
             if self.config.get("refresh_token"):
                 self._refresh_token()
                 self._init_spotify_client()
-        self.username = self.sp.current_user()["display_name"]
+        self.username = self._get_current_user()["display_name"]
+
+    def _get_current_user(self) -> Dict:
+        """Fetch the current user once and reuse it; the record only changes
+        when the token does, and _refresh_token drops the memo."""
+        if self._current_user is None:
+            self._current_user = self.sp.current_user()
+        return self._current_user
 
     @utils.validate
     def search(self, query: str, qtype: str = "track", limit=10, device=None):
@@ -237,47 +360,60 @@ class Client:
         - item_uri: uri. Looks like 'spotify:track:xxxxxx', 'spotify:album:xxxxxx', etc.
         """
         _, qtype, item_id = item_uri.split(":")
-        match qtype:
-            case "track":
-                return utils.parse_track(self.sp.track(item_id), detailed=True)
-            case "album":
-                album_info = utils.parse_album(self.sp.album(item_id), detailed=True)
-                return album_info
-            case "artist":
-                artist_info = utils.parse_artist(self.sp.artist(item_id), detailed=True)
-                albums = self.sp.artist_albums(item_id)
-                top_tracks = self.sp.artist_top_tracks(item_id)["tracks"]
-                albums_and_tracks = {"albums": albums, "tracks": {"items": top_tracks}}
-                parsed_info = utils.parse_search_results(
-                    albums_and_tracks, qtype="album,track"
-                )
-                artist_info["top_tracks"] = parsed_info["tracks"]
-                artist_info["albums"] = parsed_info["albums"]
-
-                return artist_info
-            case "playlist":
-                if self.username is None:
-                    self.set_username()
-                playlist = self.sp.playlist(item_id)
-                self.logger.info(f"playlist info is {playlist}")
-                playlist_info = utils.parse_playlist(
-                    playlist, self.username, detailed=True
-                )
+        handler = self._info_handlers.get(qtype)
+        if handler is None:
+            raise ValueError(f"Unknown qtype {qtype}")
+        return handler(item_id)
+
+    def _info_track(self, item_id: str) -> dict:
+        return utils.parse_track(self.sp.track(item_id), detailed=True)
+
+    def _info_album(self, item_id: str) -> dict:
+        return utils.parse_album(self.sp.album(item_id), detailed=True)
+
+    def _info_artist(self, item_id: str) -> dict:
+        # The three lookups are independent round-trips; run them
+        # concurrently so latency is max(RTTs) instead of the sum.
+        pool = _get_io_pool()
+        artist_future = pool.submit(self.sp.artist, item_id)
+        albums_future = pool.submit(self.sp.artist_albums, item_id)
+        top_tracks_future = pool.submit(self.sp.artist_top_tracks, item_id)
+        artist_info = utils.parse_artist(artist_future.result(), detailed=True)
+        albums = albums_future.result()
+        top_tracks = top_tracks_future.result()["tracks"]
+        albums_and_tracks = {"albums": albums, "tracks": {"items": top_tracks}}
+        parsed_info = utils.parse_search_results(
+            albums_and_tracks, qtype="album,track"
+        )
+        artist_info["top_tracks"] = parsed_info["tracks"]
+        artist_info["albums"] = parsed_info["albums"]
 
-                return playlist_info
+        return artist_info
 
-        raise ValueError(f"Unknown qtype {qtype}")
+    def _info_playlist(self, item_id: str) -> dict:
+        if self.username is None:
+            self.set_username()
+        playlist = self.sp.playlist(item_id)
+        # Deferred %-formatting and DEBUG level: the full playlist dict can
+        # run to hundreds of KB and should never be stringified at INFO.
+        self.logger.debug("playlist info is %r", playlist)
+        return utils.parse_playlist(playlist, self.username, detailed=True)
 
     def get_current_track(self) -> Optional[Dict]:
         """Get information about the currently playing track"""
+        cached = self._current_track_cache
+        if cached is not None and time.monotonic() - cached[0] < _CURRENT_TRACK_TTL:
+            return cached[1]
         try:
             # current_playback vs current_user_playing_track?
             current = self.sp.current_user_playing_track()
             if not current:
                 self.logger.info("No playback session found")
+                self._current_track_cache = (time.monotonic(), None)
                 return None
             if current.get("currently_playing_type") != "track":
                 self.logger.info("Current playback is not a track")
+                self._current_track_cache = (time.monotonic(), None)
                 return None
 
             track_info = utils.parse_track(current["item"])
@@ -287,6 +423,7 @@ class Client:
             self.logger.info(
                 f"Current track: {track_info.get('name', 'Unknown')} by {track_info.get('artist', 'Unknown')}"
             )
+            self._current_track_cache = (time.monotonic(), track_info)
             return track_info
         except Exception as e:
             self.logger.error("Error getting current track info.")
@@ -303,12 +440,13 @@ class Client:
                 f"Starting playback for spotify_uri: {spotify_uri} on {device}"
             )
             if not spotify_uri:
-                if self.is_track_playing():
+                current = self.get_current_track()
+                if current and current.get("is_playing"):
                     self.logger.info(
                         "No track_id provided and playback already active."
                     )
                     return
-                if not self.get_current_track():
+                if not current:
                     raise ValueError(
                         "No track_id provided and no current playback to resume."
                     )
@@ -332,7 +470,9 @@ class Client:
             result = self.sp.start_playback(
                 uris=uris, context_uri=context_uri, device_id=device_id
             )
-            self.logger.info(f"Playback result: {result}")
+            self._current_track_cache = None
+            self._devices_cache = None
+            self.logger.debug("Playback result: %r", result)
             return result
         except Exception as e:
             self.logger.error(f"Error starting playback: {str(e)}.")
@@ -341,9 +481,16 @@ class Client:
     @utils.validate
     def pause_playback(self, device=None):
         """Pauses playback."""
-        playback = self.sp.current_playback()
-        if playback and playback.get("is_playing"):
+        # No current_playback() pre-check: pausing an already-paused (or
+        # missing) player just errors, which is cheaper to catch than an
+        # extra round-trip on every pause.
+        try:
             self.sp.pause_playback(device.get("id") if device else None)
+        except spotipy.SpotifyException as e:
+            if e.http_status not in (403, 404):
+                raise
+        self._current_track_cache = None
+        self._devices_cache = None
 
     @utils.validate
     def add_to_queue(self, track_id: str, device=None):
@@ -402,12 +549,94 @@ class Client:
         - limit: Max number of tracks to return.
         - offset: The index of the first track to return.
         """
-        tracks = self.sp.playlist_tracks(playlist_id, limit=limit, offset=offset)
+        tracks = self.sp.playlist_tracks(playlist_id, limit=limit, offset=offset, fields=TRACK_FIELDS)
         if not tracks:
             raise ValueError("No tracks found.")
         return utils.parse_tracks(tracks["items"])
     
     @utils.ensure_username
+    def iter_playlist_track_pages(self, playlist_id: str):
+        """
+        Yield playlist data page by page: first a header dict with playlist
+        info, then one {"tracks": [...]} dict per 100-track page, so callers
+        never hold more than one page in memory. A {"warning": ...} dict is
+        yielded last if pagination had to stop early.
+        - playlist_id: ID of the playlist to get tracks from.
+        """
+        # Get playlist info
+        playlist = self.sp.playlist(playlist_id, fields="name,description,owner,tracks.total")
+        if not playlist:
+            raise ValueError("No playlist found.")
+
+        limit = 100  # Max allowed by Spotify API
+        offset = 0
+        total = playlist["tracks"]["total"]
+
+        yield {
+            "playlist_id": playlist_id,
+            "name": playlist.get("name", "Unknown"),
+            "description": playlist.get("description", ""),
+            "owner": playlist.get("owner", {}).get("display_name", "Unknown"),
+            "total_tracks": total,
+        }
+
+        self.logger.info(f"Fetching all {total} tracks from playlist {playlist.get('name', playlist_id)}")
+
+        # Keep a small window of page fetches in flight on the shared pool:
+        # pages download concurrently but are yielded strictly in offset
+        # order, and memory stays bounded by the window size.
+        offsets = iter(range(0, total, limit))
+        pending = deque()
+        pool = _get_io_pool()
+        for page_offset in islice(offsets, _PAGE_FETCH_WINDOW):
+            pending.append(
+                (page_offset, pool.submit(self._fetch_playlist_page, playlist_id, page_offset, limit))
+            )
+
+        while pending:
+            page_offset, future = pending.popleft()
+            try:
+                tracks_batch = future.result()
+            except Exception:
+                self.logger.error(f"Failed to fetch tracks at offset {page_offset} after {_PAGE_MAX_RETRIES} attempts")
+                for _, queued in pending:
+                    queued.cancel()
+                # Yield partial results rather than failing completely
+                yield {
+                    "warning": f"Only fetched {page_offset} of {total} tracks due to API errors"
+                }
+                return
+
+            next_offset = next(offsets, None)
+            if next_offset is not None:
+                pending.append(
+                    (next_offset, pool.submit(self._fetch_playlist_page, playlist_id, next_offset, limit))
+                )
+
+            if tracks_batch and tracks_batch.get("items"):
+                yield {"tracks": utils.parse_tracks(tracks_batch["items"])}
+                self.logger.info(f"Fetched {min(page_offset + limit, total)}/{total} tracks")
+            else:
+                self.logger.warning(f"No tracks returned at offset {page_offset}, stopping pagination")
+                for _, queued in pending:
+                    queued.cancel()
+                break
+
+    def _fetch_playlist_page(self, playlist_id: str, offset: int, limit: int) -> Dict:
+        """Fetch one page of playlist tracks with retry + exponential backoff,
+        requesting only the fields the parser consumes."""
+        for retry_count in range(1, _PAGE_MAX_RETRIES + 1):
+            try:
+                return self.sp.playlist_tracks(
+                    playlist_id, limit=limit, offset=offset, fields=TRACK_FIELDS
+                )
+            except Exception as e:
+                self.logger.error(f"Error fetching tracks (attempt {retry_count}/{_PAGE_MAX_RETRIES}): {e}")
+                if retry_count >= _PAGE_MAX_RETRIES:
+                    raise
+                # Wait a bit before retrying (exponential backoff)
+                time.sleep(2 ** retry_count)
+
     def get_all_playlist_tracks(self, playlist_id: str) -> Dict:
         """
         Get ALL tracks from a playlist, handling pagination automatically.
@@ -415,63 +644,15 @@ class Client:
         - playlist_id: ID of the playlist to get tracks from.
         """
         try:
-            # Get playlist info
-            playlist = self.sp.playlist(playlist_id, fields="name,description,owner,tracks.total")
-            if not playlist:
-                raise ValueError("No playlist found.")
-            
-            all_tracks = []
-            limit = 100  # Max allowed by Spotify API
-            offset = 0
-            total = playlist["tracks"]["total"]
-            
-            self.logger.info(f"Fetching all {total} tracks from playlist {playlist.get('name', playlist_id)}")
-            
-            # Fetch all tracks using pagination
-            max_retries = 3
-            while offset < total:
-                retry_count = 0
-                tracks_batch = None
-                
-                while retry_count < max_retries:
-                    try:
-                        tracks_batch = self.sp.playlist_tracks(playlist_id, limit=limit, offset=offset)
-                        break
-                    except Exception as e:
-                        retry_count += 1
-                        self.logger.error(f"Error fetching tracks (attempt {retry_count}/{max_retries}): {e}")
-                        if retry_count >= max_retries:
-                            self.logger.error(f"Failed to fetch tracks at offset {offset} after {max_retries} attempts")
-                            # Return partial results rather than failing completely
-                            return {
-                                "playlist_id": playlist_id,
-                                "name": playlist.get("name", "Unknown"),
-                                "description": playlist.get("description", ""),
-                                "owner": playlist.get("owner", {}).get("display_name", "Unknown"),
-                                "total_tracks": total,
-                                "tracks": all_tracks,
-                                "warning": f"Only fetched {len(all_tracks)} of {total} tracks due to API errors"
-                            }
-                        # Wait a bit before retrying (exponential backoff)
-                        time.sleep(2 ** retry_count)
-                
-                if tracks_batch and tracks_batch.get("items"):
-                    parsed_tracks = utils.parse_tracks(tracks_batch["items"])
-                    all_tracks.extend(parsed_tracks)
-                    offset += limit
-                    self.logger.info(f"Fetched {min(offset, total)}/{total} tracks")
+            pages = self.iter_playlist_track_pages(playlist_id)
+            result = next(pages)
+            result["tracks"] = []
+            for page in pages:
+                if "warning" in page:
+                    result["warning"] = page["warning"]
                 else:
-                    self.logger.warning(f"No tracks returned at offset {offset}, stopping pagination")
-                    break
-            
-            return {
-                "playlist_id": playlist_id,
-                "name": playlist.get("name", "Unknown"),
-                "description": playlist.get("description", ""),
-                "owner": playlist.get("owner", {}).get("display_name", "Unknown"),
-                "total_tracks": total,
-                "tracks": all_tracks
-            }
+                    result["tracks"].extend(page["tracks"])
+            return result
         except Exception as e:
             self.logger.error(f"Error fetching playlist tracks: {e}")
             raise
@@ -492,12 +673,19 @@ class Client:
             raise ValueError("No track IDs provided.")
 
         try:
-            response = self.sp.playlist_add_items(
-                playlist_id, track_ids, position=position
-            )
-            self.logger.info(
-                f"Response from adding tracks: {track_ids} to playlist {playlist_id}: {response}"
-            )
+            # The endpoint caps out at 100 IDs per call; chunks are sent
+            # sequentially so tracks land in the order the caller gave them
+            # (parallel appends would interleave chunks).
+            for i in range(0, len(track_ids), _PLAYLIST_MUTATE_CHUNK):
+                chunk = track_ids[i:i + _PLAYLIST_MUTATE_CHUNK]
+                chunk_position = None if position is None else position + i
+                response = self.sp.playlist_add_items(
+                    playlist_id, chunk, position=chunk_position
+                )
+                self.logger.debug(
+                    "Response from adding tracks: %r to playlist %s: %r",
+                    chunk, playlist_id, response
+                )
         except Exception as e:
             self.logger.error(f"Error adding tracks to playlist: {str(e)}")
 
@@ -514,12 +702,21 @@ class Client:
             raise ValueError("No track IDs provided.")
 
         try:
-            response = self.sp.playlist_remove_all_occurrences_of_items(
-                playlist_id, track_ids
-            )
-            self.logger.info(
-                f"Response from removing tracks: {track_ids} from playlist {playlist_id}: {response}"
-            )
+            # Removal is order-independent, so the 100-ID chunks can go out
+            # concurrently on the shared pool.
+            futures = [
+                _get_io_pool().submit(
+                    self.sp.playlist_remove_all_occurrences_of_items,
+                    playlist_id, track_ids[i:i + _PLAYLIST_MUTATE_CHUNK]
+                )
+                for i in range(0, len(track_ids), _PLAYLIST_MUTATE_CHUNK)
+            ]
+            for future in futures:
+                response = future.result()
+                self.logger.debug(
+                    "Response from removing tracks: %r from playlist %s: %r",
+                    track_ids, playlist_id, response
+                )
         except Exception as e:
             self.logger.error(f"Error removing tracks from playlist: {str(e)}")
 
@@ -544,15 +741,22 @@ class Client:
             response = self.sp.playlist_change_details(
                 playlist_id, name=name, description=description
             )
-            self.logger.info(f"Response from changing playlist details: {response}")
+            self.logger.debug("Response from changing playlist details: %r", response)
         except Exception as e:
             self.logger.error(f"Error changing playlist details: {str(e)}")
 
     def get_devices(self) -> dict:
-        return self.sp.devices()["devices"]
+        # is_active_device and _get_candidate_device often run back to back
+        # in validator chains; serve both from one fetch within the TTL.
+        cached = self._devices_cache
+        if cached is not None and time.monotonic() - cached[0] < _DEVICES_TTL:
+            return cached[1]
+        devices = self.sp.devices()["devices"]
+        self._devices_cache = (time.monotonic(), devices)
+        return devices
 
     def is_active_device(self):
-        return any([device.get("is_active") for device in self.get_devices()])
+        return any(device.get("is_active") for device in self.get_devices())
 
     def _get_candidate_device(self):
         devices = self.get_devices()
@@ -598,12 +802,15 @@ class Client:
         # todo: Better error handling
         for _ in range(n):
             self.sp.next_track()
+        self._current_track_cache = None
 
     def previous_track(self):
         self.sp.previous_track()
+        self._current_track_cache = None
 
     def seek_to_position(self, position_ms):
         self.sp.seek_track(position_ms=position_ms)
+        self._current_track_cache = None
 
     def set_volume(self, volume_percent):
         self.sp.volume(volume_percent)
@@ -630,33 +837,25 @@ class Client:
                 else:
                     raise ValueError("No authorization code found in the provided URL")
 
-            client_id = self.config.get("client_id") or CLIENT_ID
-            client_secret = self.config.get("client_secret") or CLIENT_SECRET
             redirect_uri = self.config.get("redirect_uri") or REDIRECT_URI
-            
-            # Prepare the request
-            auth_str = f"{client_id}:{client_secret}"
-            auth_bytes = auth_str.encode('ascii')
-            auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
-            
-            headers = {
-                "Authorization": f"Basic {auth_b64}",
-                "Content-Type": "application/x-www-form-urlencoded"
-            }
-            
+
+            headers = self._token_headers()
+            if headers is None:
+                raise ValueError("Spotify client credentials are not configured")
+
             data = {
                 "grant_type": "authorization_code",
                 "code": code,
                 "redirect_uri": redirect_uri
             }
             
-            response = requests.post("https://accounts.spotify.com/api/token", headers=headers, data=data)
+            response = self._http.post(TOKEN_URL, headers=headers, data=data, timeout=_TOKEN_TIMEOUT)
             
             if response.status_code != 200:
                 self.logger.error(f"Token exchange failed: {response.text}")
                 raise Exception(f"Failed to exchange code: {response.text}")
             
-            token_info = response.json()
+            token_info = orjson.loads(response.content)
             
             # Store tokens in config
             self.config["access_token"] = token_info["access_token"]
@@ -666,9 +865,11 @@ class Client:
             expires_in = token_info.get("expires_in", 3600)
             expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
             self.config["expires_at"] = expires_at.isoformat()
-            
+            self._expires_at_epoch = expires_at.timestamp()
+
             self._save_config()
-            
+            self._current_user = None
+
             # Reinitialize the client with new tokens
             self._init_spotify_client()
             
@@ -686,7 +887,7 @@ class Client:
                 # Make sure we have a valid client
                 if not self.sp:
                     self._init_spotify_client()
-                user_info = self.sp.current_user()
+                user_info = self._get_current_user()
                 username = user_info.get("display_name", user_info.get("id", "Unknown"))
                 return f"Authenticated as: {username}"
             else:
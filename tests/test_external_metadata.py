@@ -1,48 +1,106 @@
 """Tests for external metadata client functionality."""
 
+import contextlib
+import json
 import pytest
 import logging
+import threading
+import time
+import requests
+import responses
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
-from src.spotify_mcp.external_metadata import ExternalMetadataClient, RateLimiter
+from spotify_plus_mcp import external_metadata
+from spotify_plus_mcp.external_metadata import ExternalMetadataClient, RateLimiter
+
+
+def response_stub(data):
+    """Build a cheap successful-response stand-in without Mock overhead."""
+    return SimpleNamespace(
+        content=json.dumps(data).encode(),
+        raise_for_status=lambda: None,
+    )
+
+
+class FakeClock:
+    """Scripted clock for rate limiter tests; advances only when told to."""
+
+    def __init__(self, now_ns=0):
+        self.now_ns = now_ns
+        self.sleep_calls = []
+        self.monotonic_calls = 0
+
+    def monotonic_ns(self):
+        self.monotonic_calls += 1
+        return self.now_ns
+
+    def sleep(self, seconds):
+        self.sleep_calls.append(seconds)
+        self.now_ns += int(seconds * 1e9)
 
 
 class TestRateLimiter:
     """Test the thread-safe rate limiter."""
-    
+
     def test_rate_limiter_initialization(self):
         """Test rate limiter initializes correctly."""
-        limiter = RateLimiter(rate_limit=1.0)
-        assert limiter._rate_limit == 1.0
-        assert limiter._last_request == 0.0
+        limiter = RateLimiter(rate_limit=1.0, thread_safe=True)
+        assert limiter._rate_limit_ns == 1_000_000_000
+        assert limiter._last_request_ns == 0
         assert limiter._lock is not None
-    
-    @patch('time.time')
-    @patch('time.sleep')
-    def test_rate_limiter_waits_when_needed(self, mock_sleep, mock_time):
-        """Test rate limiter sleeps when requests are too frequent."""
-        # Mock time progression
-        mock_time.side_effect = [0.0, 0.5, 0.5]  # First call, check time, set time
-        
-        limiter = RateLimiter(rate_limit=1.0)
-        limiter._last_request = 0.0
+
+    def test_rate_limiter_no_lock(self):
+        """Test thread_safe=False swaps the lock for a no-op context manager."""
+        clock = FakeClock(now_ns=500_000_000)
+
+        limiter = RateLimiter(rate_limit=1.0, clock=clock, thread_safe=False)
+        assert isinstance(limiter._lock, contextlib.nullcontext)
+
+        # Same pacing behavior, just without synchronization.
         limiter.wait_if_needed()
-        
-        # Should sleep for 0.5 seconds (1.0 - 0.5)
-        mock_sleep.assert_called_once_with(0.5)
-    
-    @patch('time.time')
-    @patch('time.sleep')
-    def test_rate_limiter_no_wait_when_not_needed(self, mock_sleep, mock_time):
-        """Test rate limiter doesn't sleep when enough time has passed."""
-        # Mock time progression
-        mock_time.side_effect = [0.0, 2.0, 2.0]  # First call, check time, set time
-        
-        limiter = RateLimiter(rate_limit=1.0)
-        limiter._last_request = 0.0
+        assert clock.sleep_calls == [0.5]
+
+    @pytest.mark.parametrize(
+        "elapsed_ns,expected_sleeps",
+        [
+            (250_000_000, [0.75]),   # 0.25s in: sleep the remaining 0.75s
+            (500_000_000, [0.5]),    # halfway through the interval
+            (999_999_999, [1e-9]),   # one nanosecond short still waits
+            (1_000_000_000, []),     # exactly at the limit: no sleep
+            (2_000_000_000, []),     # well past the limit
+        ],
+    )
+    def test_rate_limiter_wait_behavior(self, elapsed_ns, expected_sleeps):
+        """Test sleeping (or not) based on time since the last request."""
+        clock = FakeClock(now_ns=elapsed_ns)
+
+        limiter = RateLimiter(rate_limit=1.0, clock=clock)
         limiter.wait_if_needed()
-        
-        # Should not sleep since 2.0 > 1.0
-        mock_sleep.assert_not_called()
+
+        assert clock.sleep_calls == expected_sleeps
+
+    def test_rate_limiter_reads_clock_once_per_call(self):
+        """Test wait_if_needed samples the clock exactly once."""
+        clock = FakeClock(now_ns=500_000_000)
+
+        limiter = RateLimiter(rate_limit=1.0, clock=clock)
+        limiter.wait_if_needed()
+
+        assert clock.monotonic_calls == 1
+
+    def test_peek_does_not_advance(self):
+        """Test peek_remaining_wait never reserves a slot or takes the lock path."""
+        clock = FakeClock(now_ns=500_000_000)
+
+        limiter = RateLimiter(rate_limit=1.0, clock=clock)
+        limiter.wait_if_needed()
+        state_before = limiter._last_request_ns
+
+        waits = {limiter.peek_remaining_wait() for _ in range(1000)}
+
+        assert waits == {1.0}
+        assert limiter._last_request_ns == state_before
+        assert clock.sleep_calls == [0.5]
 
 
 class TestExternalMetadataClient:
@@ -62,18 +120,19 @@ class TestExternalMetadataClient:
         """Test client initializes correctly."""
         client = ExternalMetadataClient(mock_logger)
         assert client.logger == mock_logger
-        assert client.session is not None
+        assert client.session is external_metadata._SHARED_SESSION
         assert 'spotify-mcp' in client.session.headers['User-Agent']
     
     def test_get_similar_artists_no_api_key(self, client):
         """Test get_similar_artists returns empty list when no API key."""
-        with patch('src.spotify_mcp.external_metadata.LASTFM_API_KEY', None):
+        with patch('spotify_plus_mcp.external_metadata.LASTFM_API_KEY', None):
             result = client.get_similar_artists("Test Artist")
             assert result == []
     
-    @patch('src.spotify_mcp.external_metadata.LASTFM_API_KEY', 'test_key')
+    @patch('spotify_plus_mcp.external_metadata.LASTFM_API_KEY', 'test_key')
+    @responses.activate
     def test_get_similar_artists_success(self, client):
-        """Test successful similar artists retrieval."""
+        """Test successful similar artists retrieval through the real session path."""
         mock_response_data = {
             'similarartists': {
                 'artist': [
@@ -86,21 +145,22 @@ class TestExternalMetadataClient:
                 ]
             }
         }
-        
-        with patch.object(client.session, 'get') as mock_get:
-            mock_response = Mock()
-            mock_response.json.return_value = mock_response_data
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
-            
-            result = client.get_similar_artists("Test Artist", limit=5)
-            
-            assert len(result) == 1
-            assert result[0]['name'] == 'Similar Artist 1'
-            assert result[0]['match_score'] == 0.85
-            assert result[0]['image'] == 'image_url'
+
+        responses.add(
+            responses.GET, external_metadata.LASTFM_BASE_URL,
+            json=mock_response_data, status=200
+        )
+
+        result = client.get_similar_artists("Test Artist", limit=5)
+
+        assert len(result) == 1
+        assert result[0]['name'] == 'Similar Artist 1'
+        assert result[0]['match_score'] == 0.85
+        assert result[0]['image'] == 'image_url'
+        # Query params went through real URL encoding.
+        assert 'artist.getsimilar' in responses.calls[0].request.url
     
-    @patch('src.spotify_mcp.external_metadata.LASTFM_API_KEY', 'test_key')
+    @patch('spotify_plus_mcp.external_metadata.LASTFM_API_KEY', 'test_key')
     def test_get_similar_artists_empty_image_list(self, client):
         """Test similar artists with empty image list doesn't crash."""
         mock_response_data = {
@@ -117,44 +177,131 @@ class TestExternalMetadataClient:
         }
         
         with patch.object(client.session, 'get') as mock_get:
-            mock_response = Mock()
-            mock_response.json.return_value = mock_response_data
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
-            
+            mock_get.return_value = response_stub(mock_response_data)
+
             result = client.get_similar_artists("Test Artist")
-            
+
             assert len(result) == 1
             assert result[0]['image'] is None  # Should be None, not crash
     
+    @responses.activate
     def test_get_similar_artists_api_error(self, client):
         """Test similar artists handles API errors gracefully."""
-        with patch('src.spotify_mcp.external_metadata.LASTFM_API_KEY', 'test_key'):
+        responses.add(
+            responses.GET, external_metadata.LASTFM_BASE_URL,
+            body=requests.exceptions.ConnectionError("API Error")
+        )
+
+        with patch('spotify_plus_mcp.external_metadata.LASTFM_API_KEY', 'test_key'):
+            result = client.get_similar_artists("Test Artist")
+
+            assert result == []
+            client.logger.error.assert_called_once()
+
+    def test_get_similar_artists_error_negative_cached(self, client):
+        """Test a failed lookup is negative-cached and not retried."""
+        with patch('spotify_plus_mcp.external_metadata.LASTFM_API_KEY', 'test_key'):
             with patch.object(client.session, 'get') as mock_get:
                 mock_get.side_effect = Exception("API Error")
-                
-                result = client.get_similar_artists("Test Artist")
-                
-                assert result == []
-                client.logger.error.assert_called_once()
+
+                assert client.get_similar_artists("Test Artist") == []
+                assert client.get_similar_artists("Test Artist") == []
+
+                # Second call is served from the negative cache.
+                assert mock_get.call_count == 1
     
+    @patch('spotify_plus_mcp.external_metadata.LASTFM_API_KEY', 'test_key')
+    def test_get_similar_artists_cached(self, client):
+        """Test repeated similar-artist lookups hit the cache, not the API."""
+        mock_response_data = {
+            'similarartists': {
+                'artist': [
+                    {
+                        'name': 'Similar Artist 1',
+                        'match': '0.85',
+                        'url': 'http://example.com',
+                        'image': []
+                    }
+                ]
+            }
+        }
+
+        with patch.object(client.session, 'get') as mock_get:
+            mock_get.return_value = response_stub(mock_response_data)
+
+            first = client.get_similar_artists("Test Artist")
+            second = client.get_similar_artists("Test Artist")
+            # Key normalization means case differences still hit the cache.
+            third = client.get_similar_artists("test artist")
+
+            assert first == second == third
+            mock_get.assert_called_once()
+
+    def test_get_similar_artists_precomputed_bypass(self, client):
+        """Test artists in the precomputed table never hit the network."""
+        rows = [{'name': 'Similar Artist 1', 'match_score': 0.85,
+                 'url': 'http://example.com', 'image': None}]
+
+        with patch.dict(external_metadata._PRECOMPUTED, {'test artist': rows}):
+            with patch.object(client.session, 'get') as mock_get:
+                result = client.get_similar_artists("Test Artist", limit=1)
+
+                assert result == rows
+                mock_get.assert_not_called()
+
+    @patch('spotify_plus_mcp.external_metadata.LASTFM_API_KEY', 'test_key')
+    def test_get_similar_artists_single_flight(self, client):
+        """Test concurrent misses for the same artist issue one request."""
+        mock_response_data = {
+            'similarartists': {
+                'artist': [
+                    {
+                        'name': 'Similar Artist 1',
+                        'match': '0.85',
+                        'url': 'http://example.com',
+                        'image': []
+                    }
+                ]
+            }
+        }
+
+        def slow_get(*args, **kwargs):
+            time.sleep(0.05)
+            return response_stub(mock_response_data)
+
+        with patch.object(client.session, 'get', side_effect=slow_get) as mock_get:
+            results = []
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(client.get_similar_artists("Test Artist"))
+                )
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert len(results) == 4
+            assert all(result == results[0] for result in results)
+            # Later callers attached to the first caller's in-flight fetch.
+            assert mock_get.call_count == 1
+
     def test_musicbrainz_rate_limiting(self, client):
         """Test MusicBrainz rate limiting is called."""
         with patch.object(client, '_respect_musicbrainz_rate_limit') as mock_rate_limit:
             with patch.object(client.session, 'get') as mock_get:
-                mock_response = Mock()
-                mock_response.json.return_value = {'recordings': []}
-                mock_response.raise_for_status.return_value = None
-                mock_get.return_value = mock_response
-                
+                mock_get.return_value = response_stub({'recordings': []})
+
                 client._get_musicbrainz_track_info("Artist", "Track")
                 
                 mock_rate_limit.assert_called_once()
     
+    @patch('spotify_plus_mcp.external_metadata.LASTFM_API_KEY', 'test_key')
     def test_enhanced_track_info_error_handling(self, client):
         """Test enhanced track info handles errors gracefully."""
         with patch.object(client, '_get_lastfm_track_info') as mock_lastfm:
-            with patch.object(client, '_get_musicbrainz_track_info') as mock_mb:
+            with patch.object(client, '_get_musicbrainz_track_and_artist') as mock_mb:
                 mock_lastfm.side_effect = Exception("Last.fm error")
                 mock_mb.side_effect = Exception("MusicBrainz error")
                 
@@ -166,4 +313,26 @@ class TestExternalMetadataClient:
                 assert result['musicbrainz_data'] is None
                 
                 # Should log errors
-                assert client.logger.error.call_count == 2
\ No newline at end of file
+                assert client.logger.error.call_count == 2
+
+    @patch('spotify_plus_mcp.external_metadata.LASTFM_API_KEY', 'test_key')
+    def test_enhanced_track_info_fetches_concurrently(self, client):
+        """Test the Last.fm and MusicBrainz fetches overlap in time."""
+        def slow_lastfm(artist, track):
+            time.sleep(0.1)
+            return {'name': track}
+
+        def slow_mb(artist, track):
+            time.sleep(0.1)
+            return ({'title': track}, {'name': artist})
+
+        with patch.object(client, '_get_lastfm_track_info', side_effect=slow_lastfm):
+            with patch.object(client, '_get_musicbrainz_track_and_artist', side_effect=slow_mb):
+                start = time.monotonic()
+                result = client.get_enhanced_track_info("Artist", "Track")
+                elapsed = time.monotonic() - start
+
+        assert result['lastfm_data'] == {'name': 'Track'}
+        assert result['musicbrainz_data'] == {'title': 'Track'}
+        # Sequential fetches would take >= 0.2s; parallel is ~0.1s.
+        assert elapsed < 0.18
\ No newline at end of file